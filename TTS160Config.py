@@ -32,9 +32,11 @@
 # SOFTWARE.
 # -----------------------------------------------------------------------------
 
+import hashlib
+import os
 import threading
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Dict, List, Union
 import sys
 import toml
 
@@ -77,6 +79,8 @@ class TTS160Config:
         self._lock = threading.RLock()
         self._dict = {}
         self._dict2 = {}
+        # Digest, size and mtime of the TOML last written to each file, to skip identical rewrites
+        self._saved_digests = {}
         
         # Use pathlib for file paths
         self._config_file = self.get_config_dir() / self.DEFAULT_CONFIG_FILE
@@ -161,14 +165,85 @@ class TTS160Config:
                 if self._dict2 or self._override_file.exists():
                     # Ensure directory exists
                     self._override_file.parent.mkdir(parents=True, exist_ok=True)
-                    with self._override_file.open('w', encoding='utf-8') as f:
-                        toml.dump(self._dict2, f)
+                    self._write_if_changed(self._override_file, self._dict2)
                 else:
                     # Save to primary config file
-                    with self._config_file.open('w', encoding='utf-8') as f:
-                        toml.dump(self._dict, f)
+                    self._write_if_changed(self._config_file, self._dict)
             except (OSError, PermissionError) as e:
                 raise TTS160ConfigError(f"Failed to save configuration: {e}") from e
+
+    def update(self, changes: Dict[str, Any]) -> List[str]:
+        """Apply several setting changes under one lock acquisition.
+
+        Unknown names are ignored.
+
+        Args:
+            changes: Setting names mapped to their new values
+
+        Returns:
+            Names of the settings that were applied
+        """
+        applied = []
+        with self._lock:
+            for name, value in changes.items():
+                if isinstance(getattr(type(self), name, None), property):
+                    setattr(self, name, value)
+                    applied.append(name)
+        return applied
+
+    def _write_if_changed(self, path: Path, data: dict) -> None:
+        """Write TOML data unless it matches what this instance last wrote.
+
+        The write is only skipped while the file on disk is still the one
+        written last (same size and modification time), so a file edited or
+        removed outside the application is rewritten.
+
+        Args:
+            path: Destination config file
+            data: Configuration dictionary to serialize
+        """
+        text = toml.dumps(data)
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+        saved = self._saved_digests.get(path)
+        if saved is not None and saved[0] == digest and saved[1:] == self._file_signature(path):
+            return
+        # Forget the previous write first, so a failed write is never skipped later
+        self._saved_digests.pop(path, None)
+        self._write_atomic(path, text)
+        self._saved_digests[path] = (digest,) + self._file_signature(path)
+
+    @staticmethod
+    def _file_signature(path: Path) -> tuple:
+        """Return (size, mtime_ns) of a file, or () if it does not exist."""
+        try:
+            st = path.stat()
+        except OSError:
+            return ()
+        return (st.st_size, st.st_mtime_ns)
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str) -> None:
+        """Write TOML text via a temporary file and an atomic rename.
+
+        A crash or full disk mid-write leaves the previous file intact
+        instead of a truncated one.
+
+        Args:
+            path: Destination config file
+            text: Serialized TOML content
+        """
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with tmp_path.open('w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            # Don't leave a partial temporary file next to the config
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
     
     def reload(self) -> None:
         """Reload configuration from files.
@@ -179,6 +254,7 @@ class TTS160Config:
         with self._lock:
             self._dict = {}
             self._dict2 = {}
+            self._saved_digests = {}
             self._load_config()
     
     # Configuration section constants
@@ -253,14 +253,14 @@ class TelescopeGUI:
             self._logger.warning(f"Invalid disclosure level: {level}")
 
     def save_config(self, changes: Dict[str, Any]) -> None:
-        """Save configuration changes.
+        """Record saved configuration changes.
+
+        The config panel has already written the values to the config object
+        before calling this, so they are not applied a second time here.
 
         Args:
             changes: Dict of changed config values.
         """
-        for key, value in changes.items():
-            if hasattr(self._config, key):
-                setattr(self._config, key, value)
         self._logger.info(f"Config saved: {list(changes.keys())}")
 
     def start_services(self) -> None:
@@ -5,9 +5,11 @@ Value Display Component
 Numeric and text value display with labels and consistent styling.
 """
 
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Optional, Tuple, Union
 from nicegui import ui
 
+from ...state import TelescopeState
+
 
 def value_display(
     label: str,
@@ -179,41 +181,41 @@ def error_display(
     """
     good_thresh, warn_thresh, error_thresh = thresholds
 
-    def format_error(arcsec: float) -> str:
-        if abs(arcsec) >= 60:
-            return f"{arcsec / 60:.1f}'"
-        return f'{arcsec:.1f}"'
-
-    def get_color_class(arcsec: float) -> str:
-        arcsec = abs(arcsec)
-        if arcsec < good_thresh:
-            return 'text-green-500'
-        elif arcsec < warn_thresh:
-            return 'text-yellow-500'
-        elif arcsec < error_thresh:
-            return 'text-orange-500'
-        return 'text-red-500'
-
     with ui.column().classes('gap-0') as container:
         ui.label(label).classes('label')
 
         value_label = ui.label().classes('value-normal mono')
 
-        if bind_from:
-            obj, attr = bind_from
+        def error_parts(arcsec: float) -> Tuple[str, str]:
+            # Single magnitude shared by text formatting and color selection
+            a = -arcsec if arcsec < 0 else arcsec
+            text = f"{arcsec / 60:.1f}'" if a >= 60 else f'{arcsec:.1f}"'
+
+            if a < good_thresh:
+                color = 'text-green-500'
+            elif a < warn_thresh:
+                color = 'text-yellow-500'
+            elif a < error_thresh:
+                color = 'text-orange-500'
+            else:
+                color = 'text-red-500'
+            return text, color
 
-            def update_error(arcsec):
-                value_label.text = format_error(arcsec)
-                # Update color class
-                value_label.classes(replace=get_color_class(arcsec))
+        def update_error(arcsec: float) -> None:
+            text, color = error_parts(arcsec)
+            value_label.text = text
+            value_label.classes(replace=f'value-normal mono {color}')
 
-            # Initial update
+        if bind_from:
+            obj, attr = bind_from
             update_error(getattr(obj, attr))
-
-            # Bind for updates (text only, color needs manual update)
-            value_label.bind_text_from(obj, attr, format_error)
+            if isinstance(obj, TelescopeState):
+                # Text and color are updated together from a field listener
+                obj.add_listener(lambda field, value: update_error(value), field_name=attr, owner=container)
+            else:
+                # Text only; color stays as set from the initial value
+                value_label.bind_text_from(obj, attr, lambda arcsec: error_parts(arcsec)[0])
         else:
-            value_label.text = format_error(value_arcsec)
-            value_label.classes(add=get_color_class(value_arcsec))
+            update_error(value_arcsec)
 
     return container
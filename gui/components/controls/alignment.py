@@ -11,6 +11,21 @@ from nicegui import ui
 from ...state import TelescopeState, AlignmentState
 
 
+# Monitor status display: state -> (indicator classes, label text)
+MONITOR_STATUS_DISPLAY = {
+    AlignmentState.DISABLED: ('indicator-inactive', 'Disabled'),
+    AlignmentState.MONITORING: ('indicator-ok indicator-pulse', 'Monitoring'),
+    AlignmentState.CAPTURING: ('indicator-warning indicator-pulse', 'Working...'),
+    AlignmentState.SOLVING: ('indicator-warning indicator-pulse', 'Working...'),
+    AlignmentState.ERROR: ('indicator-error', 'Error'),
+}
+# Remaining states show a plain warning with the capitalized state name
+MONITOR_STATUS_DISPLAY.update({
+    s: ('indicator-warning', s.value.capitalize())
+    for s in AlignmentState if s not in MONITOR_STATUS_DISPLAY
+})
+
+
 def alignment_controls(
     state: TelescopeState,
     on_sync: Callable[[float, float], None],
@@ -75,28 +90,12 @@ def alignment_controls(
                 monitor_label = ui.label()
 
                 def update_monitor_status():
+                    indicator_class, text = MONITOR_STATUS_DISPLAY[state.alignment_state]
                     monitor_ind.classes(
-                        remove='indicator-ok indicator-warning indicator-inactive indicator-pulse'
+                        remove='indicator-ok indicator-warning indicator-error indicator-inactive indicator-pulse'
                     )
-
-                    if state.alignment_state == AlignmentState.DISABLED:
-                        monitor_ind.classes(add='indicator-inactive')
-                        monitor_label.text = 'Disabled'
-                    elif state.alignment_state == AlignmentState.MONITORING:
-                        monitor_ind.classes(add='indicator-ok indicator-pulse')
-                        monitor_label.text = 'Monitoring'
-                    elif state.alignment_state in (
-                        AlignmentState.CAPTURING,
-                        AlignmentState.SOLVING,
-                    ):
-                        monitor_ind.classes(add='indicator-warning indicator-pulse')
-                        monitor_label.text = 'Working...'
-                    elif state.alignment_state == AlignmentState.ERROR:
-                        monitor_ind.classes(add='indicator-error')
-                        monitor_label.text = 'Error'
-                    else:
-                        monitor_ind.classes(add='indicator-warning')
-                        monitor_label.text = state.alignment_state.value.capitalize()
+                    monitor_ind.classes(add=indicator_class)
+                    monitor_label.text = text
 
                 update_monitor_status()
 
@@ -145,10 +144,7 @@ def alignment_controls(
             with ui.row().classes('items-center gap-2'):
                 ui.label('Camera:').classes('label')
                 camera_label = ui.label().classes('mono text-sm')
-                camera_label.bind_text_from(
-                    state, 'camera_source',
-                    lambda s: s.upper()
-                )
+                camera_label.bind_text_from(state, 'camera_source_upper')
 
     return container
 
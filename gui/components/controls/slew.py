@@ -5,6 +5,7 @@ Slew Controls Component
 Directional slew controls, speed selection, and GoTo functionality.
 """
 
+from functools import partial
 from typing import Callable, Optional
 from nicegui import ui
 
@@ -55,14 +56,14 @@ def slew_controls(
                 with ui.column().classes('items-center gap-1'):
                     # North button
                     btn_n = ui.button('N').classes('w-12 h-12')
-                    btn_n.on('mousedown', lambda: on_slew_start('n'))
+                    btn_n.on('mousedown', partial(on_slew_start, 'n'))
                     btn_n.on('mouseup', on_slew_stop)
                     btn_n.on('mouseleave', on_slew_stop)
 
                     # E/Stop/W row
                     with ui.row().classes('gap-1'):
                         btn_w = ui.button('W').classes('w-12 h-12')
-                        btn_w.on('mousedown', lambda: on_slew_start('w'))
+                        btn_w.on('mousedown', partial(on_slew_start, 'w'))
                         btn_w.on('mouseup', on_slew_stop)
                         btn_w.on('mouseleave', on_slew_stop)
 
@@ -73,13 +74,13 @@ def slew_controls(
                         btn_stop.on('click', on_slew_stop)
 
                         btn_e = ui.button('E').classes('w-12 h-12')
-                        btn_e.on('mousedown', lambda: on_slew_start('e'))
+                        btn_e.on('mousedown', partial(on_slew_start, 'e'))
                         btn_e.on('mouseup', on_slew_stop)
                         btn_e.on('mouseleave', on_slew_stop)
 
                     # South button
                     btn_s = ui.button('S').classes('w-12 h-12')
-                    btn_s.on('mousedown', lambda: on_slew_start('s'))
+                    btn_s.on('mousedown', partial(on_slew_start, 's'))
                     btn_s.on('mouseup', on_slew_stop)
                     btn_s.on('mouseleave', on_slew_stop)
 
@@ -167,14 +168,14 @@ def directional_pad(
     with ui.column().classes('items-center gap-1') as container:
         # North
         btn_n = ui.button('N').classes(btn_size)
-        btn_n.on('mousedown', lambda: on_slew_start('n'))
+        btn_n.on('mousedown', partial(on_slew_start, 'n'))
         btn_n.on('mouseup', on_slew_stop)
         btn_n.on('mouseleave', on_slew_stop)
 
         # E/Stop/W
         with ui.row().classes('gap-1'):
             btn_w = ui.button('W').classes(btn_size)
-            btn_w.on('mousedown', lambda: on_slew_start('w'))
+            btn_w.on('mousedown', partial(on_slew_start, 'w'))
             btn_w.on('mouseup', on_slew_stop)
             btn_w.on('mouseleave', on_slew_stop)
 
@@ -182,13 +183,13 @@ def directional_pad(
             btn_stop.on('click', on_slew_stop)
 
             btn_e = ui.button('E').classes(btn_size)
-            btn_e.on('mousedown', lambda: on_slew_start('e'))
+            btn_e.on('mousedown', partial(on_slew_start, 'e'))
             btn_e.on('mouseup', on_slew_stop)
             btn_e.on('mouseleave', on_slew_stop)
 
         # South
         btn_s = ui.button('S').classes(btn_size)
-        btn_s.on('mousedown', lambda: on_slew_start('s'))
+        btn_s.on('mousedown', partial(on_slew_start, 's'))
         btn_s.on('mouseup', on_slew_stop)
         btn_s.on('mouseleave', on_slew_stop)
 
@@ -19,6 +19,9 @@ TRACKING_RATES = [
     ('King', 'king'),
 ]
 
+# Select options (rate -> display name), shared by every rate selector
+TRACKING_RATE_OPTIONS = {rate: name for name, rate in TRACKING_RATES}
+
 
 def tracking_controls(
     state: TelescopeState,
@@ -47,42 +50,23 @@ def tracking_controls(
             with ui.row().classes('items-center justify-between w-full'):
                 ui.label('Tracking').classes('text-base')
 
-                # Toggle switch
-                tracking_switch = ui.switch(
+                # Toggle switch, following state (one-way: the device confirms changes)
+                ui.switch(
                     value=state.tracking_enabled,
                     on_change=lambda e: on_toggle(e.value)
-                )
-
-                # Bind to state for updates
-                def update_switch():
-                    tracking_switch.value = state.tracking_enabled
-
-                def on_state_change(field, value):
-                    if field == 'tracking_enabled':
-                        update_switch()
-
-                state.add_listener(on_state_change)
+                ).bind_value_from(state, 'tracking_enabled')
 
             # Rate selector (Layer 2)
             with ui.column().classes('gap-2 disclosure-2'):
                 ui.label('Tracking Rate').classes('label')
 
                 rate_select = ui.select(
-                    options={rate: name for name, rate in TRACKING_RATES},
+                    options=TRACKING_RATE_OPTIONS,
                     value=state.tracking_rate,
                     on_change=lambda e: on_rate_change(e.value)
                 ).classes('w-full')
                 rate_select.props('dense outlined')
-
-                # Bind to state
-                def update_rate():
-                    rate_select.value = state.tracking_rate
-
-                def on_rate_state_change(field, value):
-                    if field == 'tracking_rate':
-                        update_rate()
-
-                state.add_listener(on_rate_state_change)
+                rate_select.bind_value_from(state, 'tracking_rate')
 
     return container
 
@@ -114,14 +98,7 @@ def tracking_toggle(
         if compact:
             switch.props('dense')
 
-        def update():
-            switch.value = state.tracking_enabled
-
-        def on_change(field, value):
-            if field == 'tracking_enabled':
-                update()
-
-        state.add_listener(on_change)
+        switch.bind_value_from(state, 'tracking_enabled')
 
     return container
 
@@ -140,19 +117,11 @@ def rate_selector(
         Select element.
     """
     select = ui.select(
-        options={rate: name for name, rate in TRACKING_RATES},
+        options=TRACKING_RATE_OPTIONS,
         value=state.tracking_rate,
         on_change=lambda e: on_rate_change(e.value)
     ).classes('w-32')
     select.props('dense outlined')
-
-    def update():
-        select.value = state.tracking_rate
-
-    def on_change(field, value):
-        if field == 'tracking_rate':
-            update()
-
-    state.add_listener(on_change)
+    select.bind_value_from(state, 'tracking_rate')
 
     return select
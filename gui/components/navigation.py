@@ -6,7 +6,7 @@ Segmented button navigation for switching between functional groups.
 Supports disclosure-level filtering.
 """
 
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 from nicegui import ui
 
 from ..state import TelescopeState, DisclosureLevel
@@ -48,6 +48,34 @@ NAV_GROUPS = {
 }
 
 
+class NavGroup(NamedTuple):
+    """Navigation group record with its minimum disclosure level as an int."""
+    id: str
+    label: str
+    icon: str
+    min_level_value: int
+    description: str
+
+
+# NAV_GROUPS frozen into ordered records for the visibility checks
+NAV_GROUP_RECORDS: Tuple[NavGroup, ...] = tuple(
+    NavGroup(group_id, info['label'], info['icon'], info['min_level'].value, info['description'])
+    for group_id, info in NAV_GROUPS.items()
+)
+
+
+def _visible_groups(level: DisclosureLevel) -> Tuple[FrozenSet[str], Optional[str]]:
+    """Return (visible group IDs, first visible group ID) for a disclosure level."""
+    visible = [g.id for g in NAV_GROUP_RECORDS if level.value >= g.min_level_value]
+    return frozenset(visible), (visible[0] if visible else None)
+
+
+# Visibility-filtered groups per disclosure level, resolved once at import
+_VISIBILITY_BY_LEVEL: Dict[DisclosureLevel, Tuple[FrozenSet[str], Optional[str]]] = {
+    level: _visible_groups(level) for level in DisclosureLevel
+}
+
+
 def segmented_nav(
     state: TelescopeState,
     on_select: Callable[[str], None],
@@ -70,11 +98,6 @@ def segmented_nav(
     buttons: Dict[str, ui.button] = {}
 
     # Define helper functions before they're used
-    def is_group_visible(group_info: dict, level: DisclosureLevel) -> bool:
-        """Check if a group should be visible at the given disclosure level."""
-        min_level = group_info['min_level']
-        return level.value >= min_level.value
-
     def select_group(group_id: str):
         """Handle group selection."""
         current_selection['value'] = group_id
@@ -93,49 +116,53 @@ def segmented_nav(
 
     def update_all_visibility():
         """Update all button visibility based on current disclosure level."""
-        for group_id, group_info in NAV_GROUPS.items():
-            btn = buttons.get(group_id)
-            if btn:
-                visible = is_group_visible(group_info, state.disclosure_level)
-                btn.set_visibility(visible)
+        visible_ids, first_visible = _VISIBILITY_BY_LEVEL[state.disclosure_level]
+
+        for gid, btn in buttons.items():
+            btn.set_visibility(gid in visible_ids)
 
         # If current selection is no longer visible, select first visible
-        current = current_selection['value']
-        current_info = NAV_GROUPS.get(current)
-        if current_info:
-            if state.disclosure_level.value < current_info['min_level'].value:
-                # Find first visible group
-                for gid, ginfo in NAV_GROUPS.items():
-                    if state.disclosure_level.value >= ginfo['min_level'].value:
-                        select_group(gid)
-                        break
+        if current_selection['value'] not in visible_ids and first_visible is not None:
+            select_group(first_visible)
 
     # Listen for disclosure level changes
     def on_disclosure_change(field, value):
         if field == 'disclosure_level':
             update_all_visibility()
 
-    state.add_listener(on_disclosure_change)
-
     # Build the UI
     with ui.row().classes('nav-segmented w-full justify-center gap-0') as container:
-        for group_id, group_info in NAV_GROUPS.items():
-            # Create button
+        visible_ids, _ = _VISIBILITY_BY_LEVEL[state.disclosure_level]
+        for group in NAV_GROUP_RECORDS:
+            # Create button; clicks are handled by the container listener below
             btn = ui.button(
-                group_info['label'],
-                icon=group_info['icon'],
-                on_click=lambda gid=group_id: select_group(gid),
-            ).classes('nav-segment-btn')
+                group.label,
+                icon=group.icon,
+            ).classes('nav-segment-btn').props(f'data-group={group.id}')
 
             # Add tooltip
-            btn.tooltip(group_info['description'])
+            btn.tooltip(group.description)
 
             # Store reference
-            buttons[group_id] = btn
+            buttons[group.id] = btn
 
             # Set initial visibility based on disclosure level
-            visible = is_group_visible(group_info, state.disclosure_level)
-            btn.set_visibility(visible)
+            btn.set_visibility(group.id in visible_ids)
+
+    # Single delegated click listener: the browser resolves which segment was
+    # clicked and emits its group ID, so no per-button handler is registered.
+    def on_nav_click(e):
+        if e.args in buttons:
+            select_group(e.args)
+
+    container.on(
+        'click',
+        on_nav_click,
+        js_handler='(e) => { const b = e.target.closest("[data-group]"); if (b) emit(b.dataset.group); }',
+    )
+
+    # Registered once the container exists, so the listener goes with it
+    state.add_listener(on_disclosure_change, owner=container)
 
     # Set initial styles
     update_button_styles()
@@ -5,6 +5,7 @@ Alignment Detail Panel
 Alignment monitor status, error display, QA verification, and controls.
 """
 
+from functools import lru_cache
 from typing import Callable, Dict
 from nicegui import ui
 
@@ -47,6 +48,55 @@ QA_STATUS_DISPLAY = {
     QAStatusCode.DISABLED: ('Disabled', 'indicator-inactive', 'QA disabled'),
 }
 
+# Display tables resolved once at import: every enum member maps to the final
+# label text and the complete class string to add, so updates are a single index.
+_STATE_APPLY = {
+    key: (text, f'{indicator_class} indicator-pulse' if pulse else indicator_class)
+    for key, (text, indicator_class, pulse) in STATE_DISPLAY.items()
+}
+
+_QA_STATUS_APPLY = {
+    key: (text, indicator_class, f'({tooltip})')
+    for key, (text, indicator_class, tooltip) in QA_STATUS_DISPLAY.items()
+}
+
+# Alignment states in which a manual measurement can be requested
+_MEASURE_STATES = frozenset({AlignmentState.CONNECTED, AlignmentState.MONITORING})
+
+# Mutually exclusive class buckets swapped by _set_class_bucket()
+_INDICATOR_CLASSES = 'indicator-ok indicator-warning indicator-error indicator-inactive indicator-pulse'
+_COLOR_CLASSES = 'text-green-500 text-yellow-500 text-orange-500 text-red-500'
+_MODEL_CLASSES = 'text-success text-error'
+
+
+def _set_class_bucket(element: ui.element, bucket: str, all_buckets: str) -> None:
+    """Replace an element's class bucket in a single class update.
+
+    Args:
+        element: Element to update.
+        bucket: Classes to apply.
+        all_buckets: Every class of the bucket family, removed first.
+    """
+    element.classes(remove=all_buckets, add=bucket)
+
+
+def _format_axis_error(arcsec: float) -> str:
+    """Format an RA/Dec error component in arcseconds."""
+    return f'{arcsec:.1f}"'
+
+
+def _format_lockout(seconds: float) -> str:
+    """Format remaining lockout time, empty when not locked out."""
+    return f'Lockout: {seconds:.0f}s' if seconds > 0 else ''
+
+
+@lru_cache(maxsize=32)
+def _synth_text(count: int) -> str:
+    """Format the synthetic point count, empty when there are none."""
+    if count <= 0:
+        return ''
+    return f'{count} synthetic point{"s" if count != 1 else ""}'
+
 
 def alignment_panel(
     state: TelescopeState,
@@ -79,38 +129,25 @@ def alignment_panel(
                 state_ind = ui.element('span').classes('indicator indicator-lg')
                 state_label = ui.label().classes('text-xl')
 
-                def update_state():
-                    display = STATE_DISPLAY.get(
-                        state.alignment_state,
-                        ('Unknown', 'indicator-inactive', False)
-                    )
-                    text, indicator_class, pulse = display
+                # Last applied alignment state, so repeats send no class patches
+                applied_state = {'value': None}
 
-                    state_ind.classes(
-                        remove='indicator-ok indicator-warning indicator-error indicator-inactive indicator-pulse'
-                    )
-                    state_ind.classes(add=indicator_class)
-                    if pulse:
-                        state_ind.classes(add='indicator-pulse')
+                def update_state():
+                    if state.alignment_state is applied_state['value']:
+                        return
+                    applied_state['value'] = state.alignment_state
+                    text, indicator_classes = _STATE_APPLY[state.alignment_state]
 
+                    _set_class_bucket(state_ind, indicator_classes, _INDICATOR_CLASSES)
                     state_label.text = text
 
                 update_state()
 
-                def on_state_change(field, value):
-                    if field == 'alignment_state':
-                        update_state()
-
-                state.add_listener(on_state_change)
-
                 # Camera source
                 with ui.row().classes('items-center gap-1 ml-auto'):
                     ui.icon('camera').classes('text-secondary')
                     camera_label = ui.label().classes('text-secondary')
-                    camera_label.bind_text_from(
-                        state, 'camera_source',
-                        lambda s: s.upper()
-                    )
+                    camera_label.bind_text_from(state, 'camera_source_upper')
 
         # Pointing Error card
         with ui.card().classes('gui-card w-full'):
@@ -122,32 +159,31 @@ def alignment_panel(
                     ui.label('Total:').classes('label')
                     total_label = ui.label().classes('text-3xl font-mono font-semibold')
 
+                    # Last applied color bucket, so class patches are only sent on transitions
+                    error_bucket = {'value': None}
+
                     def format_and_color_error():
                         arcsec = state.alignment_error_arcsec
                         text = format_error(arcsec)
                         total_label.text = text
 
                         # Color class based on thresholds
-                        total_label.classes(
-                            remove='text-green-500 text-yellow-500 text-orange-500 text-red-500'
-                        )
                         arcsec = abs(arcsec)
                         if arcsec < 30:
-                            total_label.classes(add='text-green-500')
+                            color = 'text-green-500'
                         elif arcsec < 60:
-                            total_label.classes(add='text-yellow-500')
+                            color = 'text-yellow-500'
                         elif arcsec < 120:
-                            total_label.classes(add='text-orange-500')
+                            color = 'text-orange-500'
                         else:
-                            total_label.classes(add='text-red-500')
+                            color = 'text-red-500'
 
-                    format_and_color_error()
+                        if color == error_bucket['value']:
+                            return
+                        error_bucket['value'] = color
+                        _set_class_bucket(total_label, color, _COLOR_CLASSES)
 
-                    def on_error_change(field, value):
-                        if field == 'alignment_error_arcsec':
-                            format_and_color_error()
-
-                    state.add_listener(on_error_change)
+                    format_and_color_error()
 
                 # RA/Dec breakdown
                 with ui.row().classes('gap-8'):
@@ -156,7 +192,7 @@ def alignment_panel(
                         ra_err = ui.label().classes('text-lg font-mono')
                         ra_err.bind_text_from(
                             state, 'alignment_error_ra',
-                            lambda e: f'{e:.1f}"'
+                            _format_axis_error
                         )
 
                     with ui.row().classes('items-baseline gap-2'):
@@ -164,7 +200,7 @@ def alignment_panel(
                         dec_err = ui.label().classes('text-lg font-mono')
                         dec_err.bind_text_from(
                             state, 'alignment_error_dec',
-                            lambda e: f'{e:.1f}"'
+                            _format_axis_error
                         )
 
         # Geometry Quality card
@@ -180,42 +216,32 @@ def alignment_panel(
                         det_label = ui.label().classes('text-2xl font-mono')
                         quality_label = ui.label().classes('text-lg')
 
+                        # Last applied (color, quality) bucket
+                        det_bucket = {'value': None}
+
                         def update_determinant():
                             det = state.geometry_determinant
                             pct = det * 100
                             det_label.text = f'{pct:.0f}%'
 
-                            det_label.classes(
-                                remove='text-green-500 text-yellow-500 text-red-500'
-                            )
-                            quality_label.classes(
-                                remove='text-green-500 text-yellow-500 text-red-500'
-                            )
-
                             if det >= 0.80:
-                                det_label.classes(add='text-green-500')
-                                quality_label.classes(add='text-green-500')
-                                quality_label.text = 'Excellent'
+                                bucket = ('text-green-500', 'Excellent')
                             elif det >= 0.60:
-                                det_label.classes(add='text-green-500')
-                                quality_label.classes(add='text-green-500')
-                                quality_label.text = 'Good'
+                                bucket = ('text-green-500', 'Good')
                             elif det >= 0.40:
-                                det_label.classes(add='text-yellow-500')
-                                quality_label.classes(add='text-yellow-500')
-                                quality_label.text = 'Marginal'
+                                bucket = ('text-yellow-500', 'Marginal')
                             else:
-                                det_label.classes(add='text-red-500')
-                                quality_label.classes(add='text-red-500')
-                                quality_label.text = 'Poor'
+                                bucket = ('text-red-500', 'Poor')
 
-                        update_determinant()
+                            if bucket == det_bucket['value']:
+                                return
+                            det_bucket['value'] = bucket
+                            color, quality_label.text = bucket
 
-                        def on_det_change(field, value):
-                            if field == 'geometry_determinant':
-                                update_determinant()
+                            _set_class_bucket(det_label, color, _COLOR_CLASSES)
+                            _set_class_bucket(quality_label, color, _COLOR_CLASSES)
 
-                        state.add_listener(on_det_change)
+                        update_determinant()
 
         # Decision Engine card (disclosure-3)
         decision_card = ui.card().classes('gui-card w-full disclosure-3')
@@ -229,7 +255,7 @@ def alignment_panel(
                     decision_label = ui.label().classes('text-lg font-mono')
                     decision_label.bind_text_from(
                         state, 'last_decision',
-                        lambda d: DECISION_DISPLAY.get(d, str(d))
+                        DECISION_DISPLAY.__getitem__
                     )
 
                 # Lockout status
@@ -239,19 +265,10 @@ def alignment_panel(
                     lockout_label = ui.label().classes('text-lg')
                     lockout_label.bind_text_from(
                         state, 'lockout_remaining_sec',
-                        lambda s: f'Lockout: {s:.0f}s' if s > 0 else ''
+                        _format_lockout
                     )
 
-                def update_lockout_visibility():
-                    lockout_row.set_visibility(state.lockout_remaining_sec > 0)
-
-                update_lockout_visibility()
-
-                def on_lockout_change(field, value):
-                    if field == 'lockout_remaining_sec':
-                        update_lockout_visibility()
-
-                state.add_listener(on_lockout_change)
+                lockout_row.bind_visibility_from(state, 'lockout_active')
 
                 # Health alert
                 alert_row = ui.row().classes('items-center gap-2 text-error')
@@ -264,12 +281,6 @@ def alignment_panel(
 
                 update_alert_visibility()
 
-                def on_alert_change(field, value):
-                    if field == 'health_alert':
-                        update_alert_visibility()
-
-                state.add_listener(on_alert_change)
-
         # QA Verification card (disclosure-3)
         qa_card = ui.card().classes('gui-card w-full disclosure-3')
         with qa_card:
@@ -281,35 +292,28 @@ def alignment_panel(
                 qa_label = ui.label().classes('text-lg')
                 qa_tooltip = ui.label().classes('text-secondary')
 
+                # Last applied QA status
+                applied_qa = {'value': None}
+
                 def update_qa_status():
-                    display = QA_STATUS_DISPLAY.get(
-                        state.qa_status,
-                        ('Unknown', 'indicator-inactive', '')
-                    )
-                    text, indicator_class, tooltip = display
+                    if state.qa_status is applied_qa['value']:
+                        return
+                    applied_qa['value'] = state.qa_status
+                    text, indicator_class, tooltip = _QA_STATUS_APPLY[state.qa_status]
 
-                    qa_ind.classes(
-                        remove='indicator-ok indicator-warning indicator-error indicator-inactive'
-                    )
-                    qa_ind.classes(add=indicator_class)
+                    _set_class_bucket(qa_ind, indicator_class, _INDICATOR_CLASSES)
                     qa_label.text = text
-                    qa_tooltip.text = f'({tooltip})'
+                    qa_tooltip.text = tooltip
 
                 update_qa_status()
 
-                def on_qa_change(field, value):
-                    if field == 'qa_status':
-                        update_qa_status()
-
-                state.add_listener(on_qa_change)
-
             # Quaternion delta
             with ui.row().classes('items-baseline gap-2 mb-2'):
                 ui.label('Quaternion Delta:').classes('label')
                 quat_delta = ui.label().classes('text-lg font-mono')
                 quat_delta.bind_text_from(
                     state, 'qa_quaternion_delta',
-                    lambda a: format_error(a)
+                    format_error
                 )
 
             # Synthetic points
@@ -319,7 +323,7 @@ def alignment_panel(
                 synth_label = ui.label()
                 synth_label.bind_text_from(
                     state, 'qa_synthetic_count',
-                    lambda c: f'{c} synthetic point{"s" if c != 1 else ""}' if c > 0 else ''
+                    _synth_text
                 )
 
             def update_synth_visibility():
@@ -327,12 +331,6 @@ def alignment_panel(
 
             update_synth_visibility()
 
-            def on_synth_change(field, value):
-                if field == 'qa_synthetic_count':
-                    update_synth_visibility()
-
-            state.add_listener(on_synth_change)
-
             # Model valid
             with ui.row().classes('items-center gap-2'):
                 model_icon = ui.icon('check_circle')
@@ -340,36 +338,22 @@ def alignment_panel(
 
                 def update_model_status():
                     if state.qa_model_valid:
-                        model_icon.classes(remove='text-error')
-                        model_icon.classes(add='text-success')
+                        _set_class_bucket(model_icon, 'text-success', _MODEL_CLASSES)
                         model_icon.text = 'check_circle'
                         model_label.text = 'Model valid'
                     else:
-                        model_icon.classes(remove='text-success')
-                        model_icon.classes(add='text-error')
+                        _set_class_bucket(model_icon, 'text-error', _MODEL_CLASSES)
                         model_icon.text = 'cancel'
                         model_label.text = 'Model invalid'
 
                 update_model_status()
 
-                def on_model_change(field, value):
-                    if field == 'qa_model_valid':
-                        update_model_status()
-
-                state.add_listener(on_model_change)
-
         # Hide QA card if disabled
         def update_qa_visibility():
             qa_card.set_visibility(state.qa_enabled)
 
         update_qa_visibility()
 
-        def on_qa_enabled_change(field, value):
-            if field == 'qa_enabled':
-                update_qa_visibility()
-
-        state.add_listener(on_qa_enabled_change)
-
         # Controls card
         with ui.card().classes('gui-card w-full'):
             ui.label('Controls').classes('section-header')
@@ -383,22 +367,18 @@ def alignment_panel(
                     on_click=lambda: measure_handler() if measure_handler else None,
                 ).props('outline')
 
+                # Last applied enabled flags, so unchanged re-broadcasts are skipped
+                applied_enabled = {'measure': None, 'sync': None}
+
                 def update_measure_enabled():
-                    active_states = [
-                        AlignmentState.CONNECTED,
-                        AlignmentState.MONITORING,
-                    ]
-                    enabled = state.alignment_state in active_states
+                    enabled = state.alignment_state in _MEASURE_STATES
+                    if enabled is applied_enabled['measure']:
+                        return
+                    applied_enabled['measure'] = enabled
                     measure_btn.set_enabled(enabled)
 
                 update_measure_enabled()
 
-                def on_measure_state_change(field, value):
-                    if field == 'alignment_state':
-                        update_measure_enabled()
-
-                state.add_listener(on_measure_state_change)
-
                 # Sync button
                 sync_handler = handlers.get('sync')
                 sync_btn = ui.button(
@@ -408,14 +388,43 @@ def alignment_panel(
                 ).props('outline')
 
                 def update_sync_enabled():
-                    sync_btn.set_enabled(state.connected and not state.slewing)
+                    enabled = bool(state.connected and not state.slewing)
+                    if enabled is applied_enabled['sync']:
+                        return
+                    applied_enabled['sync'] = enabled
+                    sync_btn.set_enabled(enabled)
 
                 update_sync_enabled()
 
-                def on_sync_state_change(field, value):
-                    if field in ('connected', 'slewing'):
-                        update_sync_enabled()
-
-                state.add_listener(on_sync_state_change)
+        # One dispatcher for the whole panel, subscribed to each field it renders
+        field_handlers = {
+            'alignment_state': (update_state, update_measure_enabled),
+            'alignment_error_arcsec': (format_and_color_error,),
+            'geometry_determinant': (update_determinant,),
+            'health_alert': (update_alert_visibility,),
+            'connected': (update_sync_enabled,),
+            'slewing': (update_sync_enabled,),
+        }
+
+        def on_state_change(field, value):
+            for handler in field_handlers[field]:
+                handler()
+
+        for field_name in field_handlers:
+            state.add_listener(on_state_change, field_name=field_name, owner=container)
+
+        # QA fields usually change together, so they share one grouped listener
+        qa_handlers = {
+            'qa_status': update_qa_status,
+            'qa_synthetic_count': update_synth_visibility,
+            'qa_model_valid': update_model_status,
+            'qa_enabled': update_qa_visibility,
+        }
+
+        def on_qa_change(changed):
+            for field_name in changed:
+                qa_handlers[field_name]()
+
+        state.add_group_listener(on_qa_change, qa_handlers, owner=container)
 
     return container
@@ -6,10 +6,38 @@ Comprehensive settings interface for telescope, GPS, alignment, and GUI configur
 Organizes settings into logical sections matching the TOML structure.
 """
 
-from typing import Any, Callable, Dict, Optional
+import json
+import logging
+import time
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from nicegui import ui
 
-from ...state import TelescopeState
+from ...state import DisclosureLevel, TelescopeState
+
+
+# Logger handed to the GPS manager accessor; keeps the 'config' name it has
+# always used, since the first caller's logger is the one the manager keeps
+_LOG = logging.getLogger('config')
+
+# Seconds of quiet after an edit before pending values are written to config
+CONFIG_APPLY_DELAY = 0.15
+
+# Seconds a GPS status reading is reused before asking the manager again
+GPS_STATUS_TTL = 1.0
+
+# Seconds between GPS button refreshes when gps_fix changes are pushed by state
+# (safety net only), and when no state is available to listen to
+GPS_FALLBACK_INTERVAL = 30.0
+GPS_POLL_INTERVAL = 2.0
+
+# Milliseconds the browser holds typed text/number edits before sending them;
+# Quasar flushes the held value on blur, before the change event fires
+INPUT_DEBOUNCE_MS = 400
+
+# Save button notifications
+SAVED_NOTIFY = {'message': 'Settings saved', 'type': 'positive'}
+NO_CHANGES_NOTIFY = {'message': 'No changes to save', 'type': 'info'}
 
 
 def config_panel(
@@ -29,7 +57,7 @@ def config_panel(
 
     Args:
         config: Configuration object with settings.
-        on_save: Callback to save configuration changes.
+        on_save: Callback with the changes, after they are applied to config.
         on_theme_change: Callback for theme changes.
         on_disclosure_change: Callback for disclosure level changes.
         state: Optional state for current theme/disclosure.
@@ -37,8 +65,27 @@ def config_panel(
     Returns:
         Container element with configuration panel.
     """
+    # Edits are written to config once the form goes quiet, in one pass
+    apply_timer = {'value': None}
+
+    def apply_pending():
+        if apply_timer['value'] is not None:
+            apply_timer['value'].cancel()
+            apply_timer['value'] = None
+        pending_changes.apply()
+
+    def schedule_apply():
+        if apply_timer['value'] is not None:
+            apply_timer['value'].cancel()
+        apply_timer['value'] = ui.timer(CONFIG_APPLY_DELAY, apply_pending, once=True)
+
+    def on_pending_change():
+        schedule_apply()
+        # Save stays disabled until there is something to save
+        save_btn.enable()
+
     # Track pending changes
-    pending_changes: Dict[str, Any] = {}
+    pending_changes = _PendingBuffer(config, on_change=on_pending_change)
 
     with ui.column().classes('w-full gap-4') as container:
         with ui.tabs().classes('w-full') as tabs:
@@ -47,28 +94,50 @@ def config_panel(
             align_tab = ui.tab('Alignment')
             gui_tab = ui.tab('GUI')
 
-        with ui.tab_panels(tabs, value=mount_tab).classes('w-full'):
-            # Mount settings (device + site + driver)
-            with ui.tab_panel(mount_tab):
-                _build_mount_section(config, pending_changes)
-
-            # GPS settings
-            with ui.tab_panel(gps_tab):
-                _build_gps_section(config, pending_changes)
-
-            # Alignment monitor settings
-            with ui.tab_panel(align_tab):
-                _build_alignment_section(config, pending_changes)
-
-            # GUI settings
-            with ui.tab_panel(gui_tab):
-                _build_gui_section(
-                    config,
-                    state,
-                    on_theme_change,
-                    on_disclosure_change,
-                    pending_changes,
-                )
+        # Tab bodies are built on first activation; each panel holds an
+        # empty mount point until then.
+        section_builders = {
+            'Mount': lambda: _build_mount_section(pending_changes, state),
+            'GPS': lambda: _build_gps_section(pending_changes),
+            'Alignment': lambda: _build_alignment_section(pending_changes, state),
+            'GUI': lambda: _build_gui_section(
+                config,
+                state,
+                on_theme_change,
+                on_disclosure_change,
+                pending_changes,
+            ),
+        }
+        section_containers: Dict[str, ui.element] = {}
+        built_sections = set()
+
+        def build_section(tab_name: str) -> None:
+            if tab_name in built_sections or tab_name not in section_builders:
+                return
+            built_sections.add(tab_name)
+            with section_containers[tab_name]:
+                section_builders[tab_name]()
+
+        def on_tab_change(e):
+            # Client-side changes report the tab name, programmatic ones the tab
+            value = e.value
+            build_section(value if isinstance(value, str) else value._props['name'])
+
+        with ui.tab_panels(tabs, value=mount_tab, on_change=on_tab_change).classes('w-full'):
+            for tab in (mount_tab, gps_tab, align_tab, gui_tab):
+                with ui.tab_panel(tab):
+                    section_containers[tab._props['name']] = ui.column().classes('w-full')
+
+        # Mount is the initial tab
+        build_section('Mount')
+
+        # One delegated listener commits every text and number field: the
+        # browser resolves the edited field from its data-prop attribute.
+        container.on(
+            'change',
+            lambda e: pending_changes.commit(e.args),
+            js_handler='(e) => { const f = e.target.closest("[data-prop]"); if (f) emit(f.dataset.prop); }',
+        )
 
         # Save button
         ui.separator().classes('my-2')
@@ -79,126 +148,515 @@ def config_panel(
             )
 
             def save_changes():
-                if pending_changes:
-                    on_save(pending_changes)
-                    # Also save to file
-                    try:
-                        config.save()
-                        ui.notify('Settings saved', type='positive')
-                    except Exception as e:
-                        ui.notify(f'Error saving: {e}', type='negative')
-                    pending_changes.clear()
-                else:
-                    ui.notify('No changes to save', type='info')
-
-            ui.button(
+                if not pending_changes:
+                    ui.notify(**NO_CHANGES_NOTIFY)
+                    return
+                apply_pending()
+                changes = pending_changes.drain()
+                on_save(changes)
+                # Write the file now, so nothing depends on this page staying
+                # open; the success notice only follows a completed write
+                try:
+                    config.save()
+                except Exception as e:
+                    # Keep the edits pending so Save can be retried
+                    pending_changes.update(changes)
+                    ui.notify(f'Error saving: {e}', type='negative')
+                    return
+                save_btn.disable()
+                ui.notify(**SAVED_NOTIFY)
+
+            save_btn = ui.button(
                 'Save Changes',
                 on_click=save_changes
             ).props('color=primary')
+            save_btn.disable()
 
     return container
 
 
+# =============================================================================
+# Section Schemas
+# =============================================================================
+#
+# Each section is a tuple of expansions: (title, icon, open, items). An item is
+# a field spec (kind, label, prop_name, kwargs) rendered by _FIELD_DISPATCH[kind],
+# ('row', (field, field)) for side-by-side fields, ('heading', text) or
+# ('separator',). The tables are built once at import and reused by every render.
+
+# Unit suffixes shown after number field labels
+_SUFFIX_MS = 'ms'
+_SUFFIX_SEC = 'seconds'
+_SUFFIX_SEC_SHORT = 'sec'
+_SUFFIX_ARCSEC = 'arcsec'
+_SUFFIX_DEG = 'degrees'
+_SUFFIX_SIGMA = 'sigma'
+_SUFFIX_M = 'meters'
+_SUFFIX_LAT = '° (+ North)'
+_SUFFIX_LON = '° (+ East)'
+
+# Select options shared by the schemas and the GUI section. Plain dicts, since
+# ui.select only treats dict options as value -> label maps.
+_BINNING_OPTIONS = {1: '1x1', 2: '2x2', 4: '4x4'}
+_BAUD_RATE_OPTIONS = {4800: '4800', 9600: '9600', 19200: '19200', 38400: '38400'}
+_FIX_QUALITY_OPTIONS = {1: 'GPS (1)', 2: 'DGPS (2)', 4: 'RTK Fixed (4)'}
+_CAMERA_SOURCE_OPTIONS = {'alpaca': 'Alpaca', 'zwo': 'ZWO Native'}
+_IMAGE_TYPE_OPTIONS = {'RAW8': 'RAW8', 'RAW16': 'RAW16', 'RGB24': 'RGB24', 'Y8': 'Y8'}
+_THEME_OPTIONS = {'light': 'Light', 'dark': 'Dark', 'astronomy': 'Astronomy (Red)'}
+_DISCLOSURE_OPTIONS = {1: 'Basic', 2: 'Expanded', 3: 'Advanced'}
+
+# Number display formats by precision
+_FMT = {0: '%.0f', 1: '%.1f', 2: '%.2f', 6: '%.6f'}
+
+# Site Location fields; the section itself is built in _build_mount_section
+# because of its Copy from GPS control
+_SITE_ITEMS = (
+    ('row', (
+        ('number', 'Latitude', 'site_latitude',
+         dict(min_val=-90, max_val=90, precision=6, suffix=_SUFFIX_LAT)),
+        ('number', 'Longitude', 'site_longitude',
+         dict(min_val=-180, max_val=180, precision=6, suffix=_SUFFIX_LON)),
+    )),
+    ('number', 'Elevation', 'site_elevation',
+     dict(min_val=0, max_val=10000, precision=1, suffix=_SUFFIX_M)),
+)
+
+_MOUNT_CONNECTION_SCHEMA = (
+    ('Connection', 'usb', False, (
+        ('serial_port', 'Serial Port *', 'dev_port', dict(hint='Mount serial port (required)')),
+    )),
+)
+
+_MOUNT_DRIVER_SCHEMA = (
+    ('Driver Settings', 'settings', False, (
+        ('switch', 'Sync time on connect *', 'sync_time_on_connect',
+         dict(hint='Set mount time from computer when connecting')),
+        ('number', 'Slew settle time *', 'slew_settle_time',
+         dict(min_val=0, max_val=30, precision=0, suffix=_SUFFIX_SEC)),
+        ('separator',),
+        ('heading', 'Pulse Guide Settings'),
+        ('switch', 'Equatorial frame', 'pulse_guide_equatorial_frame',
+         dict(hint='Move mount in equatorial frame for pulse guides')),
+        ('switch', 'Altitude compensation', 'pulse_guide_altitude_compensation',
+         dict(hint='Compensate azimuth pulse length for mount altitude')),
+        ('row', (
+            ('number', 'Max compensation', 'pulse_guide_max_compensation',
+             dict(min_val=0, max_val=5000, precision=0, suffix=_SUFFIX_MS)),
+            ('number', 'Compensation buffer', 'pulse_guide_compensation_buffer',
+             dict(min_val=0, max_val=500, precision=0, suffix=_SUFFIX_MS)),
+        )),
+    )),
+)
+
+_GPS_SCHEMA = (
+    ('GPS Dongle', 'gps_fixed', True, (
+        ('switch', 'Enable GPS', 'gps_enabled',
+         dict(hint='Enable GPS dongle for automatic location updates')),
+        ('serial_port_auto', 'Serial Port', 'gps_port',
+         dict(hint='"auto" to scan for GPS, or specific port')),
+        ('row', (
+            ('select', 'Baud Rate', 'gps_baudrate',
+             dict(options=_BAUD_RATE_OPTIONS)),
+            ('number', 'Read timeout', 'gps_read_timeout',
+             dict(min_val=0.5, max_val=10, precision=1, suffix=_SUFFIX_SEC_SHORT)),
+        )),
+    )),
+    ('Fix Requirements', 'signal_cellular_alt', False, (
+        ('select', 'Minimum fix quality', 'gps_min_fix_quality',
+         dict(options=_FIX_QUALITY_OPTIONS)),
+        ('number', 'Minimum satellites', 'gps_min_satellites',
+         dict(min_val=1, max_val=20, precision=0)),
+    )),
+    ('Behavior', 'tune', False, (
+        ('switch', 'Push location on connect', 'gps_push_on_connect',
+         dict(hint='Send GPS location to mount when telescope connects')),
+        ('input', 'Location name', 'gps_location_name',
+         dict(placeholder='GPS', hint='Name sent to mount (max 10 chars)')),
+        ('switch', 'Verbose logging', 'gps_verbose_logging',
+         dict(hint='Log NMEA sentences for debugging')),
+    )),
+)
+
+_ALIGNMENT_SCHEMA = (
+    ('Alignment Monitor', 'center_focus_strong', True, (
+        ('switch', 'Enable alignment monitor', 'alignment_enabled',
+         dict(hint='Enable plate solving for pointing accuracy monitoring')),
+        ('number', 'Measurement interval', 'alignment_interval',
+         dict(min_val=5, max_val=600, precision=0, suffix=_SUFFIX_SEC)),
+        ('number', 'Error warning threshold', 'alignment_error_threshold',
+         dict(min_val=1, max_val=600, precision=0, suffix=_SUFFIX_ARCSEC)),
+        ('switch', 'Verbose logging', 'alignment_verbose_logging', {}),
+    )),
+    ('Camera Source', 'camera', False, (
+        ('select', 'Camera source', 'alignment_camera_source',
+         dict(options=_CAMERA_SOURCE_OPTIONS)),
+        ('separator',),
+        ('heading', 'Alpaca Camera Settings'),
+        ('row', (
+            ('input', 'Server address', 'alignment_camera_address',
+             dict(placeholder='127.0.0.1')),
+            ('number', 'Port', 'alignment_camera_port',
+             dict(min_val=1, max_val=65535, precision=0)),
+        )),
+        ('number', 'Device number', 'alignment_camera_device',
+         dict(min_val=0, max_val=10, precision=0)),
+        ('separator',),
+        ('heading', 'ZWO Native Settings'),
+        ('number', 'Camera ID', 'zwo_camera_id',
+         dict(min_val=0, max_val=10, precision=0, hint='Camera index (0 for first ZWO camera)')),
+        ('row', (
+            ('number', 'Exposure', 'zwo_exposure_ms',
+             dict(min_val=1, max_val=60000, precision=0, suffix=_SUFFIX_MS)),
+            ('number', 'Gain', 'zwo_gain',
+             dict(min_val=0, max_val=500, precision=0)),
+        )),
+        ('row', (
+            ('select', 'Binning', 'zwo_binning', dict(options=_BINNING_OPTIONS)),
+            ('select', 'Image type', 'zwo_image_type', dict(options=_IMAGE_TYPE_OPTIONS)),
+        )),
+    )),
+    ('Capture Settings', 'photo_camera', False, (
+        ('number', 'Exposure time', 'alignment_exposure_time',
+         dict(min_val=0.1, max_val=60, precision=1, suffix=_SUFFIX_SEC)),
+        ('select', 'Binning', 'alignment_binning', dict(options=_BINNING_OPTIONS)),
+    )),
+    ('Plate Solving', 'auto_fix_high', False, (
+        ('number', 'Field of view estimate', 'alignment_fov_estimate',
+         dict(min_val=0.1, max_val=30, precision=2, suffix=_SUFFIX_DEG)),
+        ('number', 'Detection threshold', 'alignment_detection_threshold',
+         dict(min_val=1, max_val=20, precision=1, suffix=_SUFFIX_SIGMA)),
+        ('number', 'Maximum stars', 'alignment_max_stars',
+         dict(min_val=10, max_val=200, precision=0)),
+        ('input', 'Database path', 'alignment_database_path',
+         dict(placeholder='tetra3_database.npz', hint='Path to tetra3 star pattern database')),
+    )),
+    ('V1 Decision Thresholds', 'rule', False, (
+        ('heading', 'Error Thresholds (arcseconds)'),
+        ('row', (
+            ('number', 'Ignore below', 'alignment_error_ignore',
+             dict(min_val=0, max_val=120, precision=0, hint='No action taken')),
+            ('number', 'Sync above', 'alignment_error_sync',
+             dict(min_val=30, max_val=300, precision=0, hint='Trigger sync')),
+        )),
+        ('row', (
+            ('number', 'Concern above', 'alignment_error_concern',
+             dict(min_val=60, max_val=600, precision=0, hint='Evaluate alignment')),
+            ('number', 'Max error', 'alignment_error_max',
+             dict(min_val=120, max_val=1200, precision=0, hint='Force action + health event')),
+        )),
+    )),
+    ('V1 Geometry Thresholds', 'category', False, (
+        ('heading', 'Determinant Quality (0-1)'),
+        ('row', (
+            ('number', 'Excellent', 'alignment_det_excellent',
+             dict(min_val=0, max_val=1, precision=2, hint='Protect this geometry')),
+            ('number', 'Good', 'alignment_det_good',
+             dict(min_val=0, max_val=1, precision=2, hint='Be selective')),
+        )),
+        ('row', (
+            ('number', 'Marginal', 'alignment_det_marginal',
+             dict(min_val=0, max_val=1, precision=2, hint='Seek improvement')),
+            ('number', 'Min improvement', 'alignment_det_improvement_min',
+             dict(min_val=0, max_val=0.5, precision=2, hint='To justify replacement')),
+        )),
+    )),
+    ('V1 Angular Constraints', 'straighten', False, (
+        ('heading', 'Distances (degrees)'),
+        ('number', 'Minimum separation', 'alignment_min_separation',
+         dict(min_val=1, max_val=90, precision=0, hint='Between alignment points')),
+        ('row', (
+            ('number', 'Refresh radius', 'alignment_refresh_radius',
+             dict(min_val=1, max_val=45, precision=0, hint='For refresh logic')),
+            ('number', 'Scale radius', 'alignment_scale_radius',
+             dict(min_val=1, max_val=90, precision=0, hint='Error weight falloff')),
+        )),
+        ('number', 'Refresh error threshold', 'alignment_refresh_error_threshold',
+         dict(min_val=10, max_val=300, precision=0, suffix=_SUFFIX_ARCSEC)),
+    )),
+    ('V1 Lockout & Health', 'timer', False, (
+        ('heading', 'Lockout Periods (seconds)'),
+        ('row', (
+            ('number', 'After alignment', 'alignment_lockout_post_align',
+             dict(min_val=0, max_val=300, precision=0)),
+            ('number', 'After sync', 'alignment_lockout_post_sync',
+             dict(min_val=0, max_val=60, precision=0)),
+        )),
+        ('separator',),
+        ('heading', 'Health Monitoring'),
+        ('number', 'Health window', 'alignment_health_window',
+         dict(min_val=60, max_val=7200, precision=0, suffix=_SUFFIX_SEC)),
+        ('number', 'Alert threshold', 'alignment_health_alert_threshold',
+         dict(min_val=1, max_val=20, precision=0, hint='Events in window to trigger alert')),
+    )),
+)
+
+
+# Expansions only shown from a disclosure level up; V1 tuning is Advanced-only
+_EXPANSION_MIN_LEVEL: Dict[str, DisclosureLevel] = {
+    'V1 Decision Thresholds': DisclosureLevel.ADVANCED,
+    'V1 Geometry Thresholds': DisclosureLevel.ADVANCED,
+    'V1 Angular Constraints': DisclosureLevel.ADVANCED,
+    'V1 Lockout & Health': DisclosureLevel.ADVANCED,
+}
+
+
+def _same(value: Any) -> Any:
+    """Pass a widget value through unchanged."""
+    return value
+
+
+def _to_int(value: Any) -> int:
+    """Coerce a whole-number field value, treating a cleared field as 0."""
+    return int(value) if value is not None else 0
+
+
+def _to_port(value: Any) -> str:
+    """Coerce a serial port selection, treating no selection as ''."""
+    return value if value else ''
+
+
+def _to_gps_port(value: Any) -> str:
+    """Coerce a GPS port selection, treating no selection as 'auto'."""
+    return value if value else 'auto'
+
+
+# Coercion of widget values by field kind; whole-number fields use _to_int
+_KIND_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    'serial_port': _to_port,
+    'serial_port_auto': _to_gps_port,
+}
+
+
+def _item_fields(items: Tuple) -> List[Tuple]:
+    """Return every field spec in a sequence of schema items, in order."""
+    fields = []
+    for item in items:
+        if item[0] == 'row':
+            fields.extend(item[1])
+        elif item[0] not in ('heading', 'separator'):
+            fields.append(item)
+    return fields
+
+
+def _schema_fields(schema: Tuple) -> List[Tuple]:
+    """Return every field spec in a section schema, in order."""
+    return [field for _title, _icon, _open, items in schema for field in _item_fields(items)]
+
+
+_SCHEMA_FIELDS = [
+    *_schema_fields(_MOUNT_CONNECTION_SCHEMA),
+    *_item_fields(_SITE_ITEMS),
+    *_schema_fields(_MOUNT_DRIVER_SCHEMA),
+    *_schema_fields(_GPS_SCHEMA),
+    *_schema_fields(_ALIGNMENT_SCHEMA),
+]
+
+# Stable index of every editable config key, used by _PendingBuffer
+_FIELD_ID: Dict[str, int] = {
+    key: index
+    for index, key in enumerate(dict.fromkeys(field[2] for field in _SCHEMA_FIELDS))
+}
+_FIELD_KEYS: Tuple[str, ...] = tuple(_FIELD_ID)
+
+
+def _field_coercer(kind: str, kwargs: Dict[str, Any]) -> Callable[[Any], Any]:
+    """Return the coercion applied to a field's widget value."""
+    if kind == 'number' and kwargs.get('precision', 1) == 0:
+        return _to_int
+    return _KIND_COERCERS.get(kind, _same)
+
+
+# Value coercion per config key, resolved once from the schemas
+_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    key: _field_coercer(kind, kwargs) for kind, _label, key, kwargs in _SCHEMA_FIELDS
+}
+
+
+class _PendingBuffer:
+    """Unsaved config edits held in field-indexed slots.
+
+    Nothing here is a set: every field has a fixed index from _FIELD_ID, and
+    the buffer keeps parallel arrays of len(_FIELD_KEYS) at that index:
+
+    - _values: list of the latest edited value
+    - _widgets: list of the widget registered by watch()
+    - _dirty: bytearray flag, 1 while the edit is not yet saved (drain())
+    - _unapplied: bytearray flag, 1 while not yet written to config (apply())
+
+    Edits are index stores and the save and apply paths each walk one flag
+    vector, mapping an index back to its key through _FIELD_KEYS. The
+    invariant is that _FIELD_ID and _FIELD_KEYS are both derived, at import,
+    from the same section schema tables (_SCHEMA_FIELDS), so index i names the
+    same key everywhere; new fields must be added to those tables rather than
+    indexed by hand. Each panel owns its own buffer.
+    """
+
+    __slots__ = ('_config', '_values', '_dirty', '_unapplied', '_widgets', '_on_change')
+
+    def __init__(self, config: Any, on_change: Optional[Callable[[], None]] = None) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            config: Configuration object that apply() writes to.
+            on_change: Called after each edit, e.g. to schedule apply().
+        """
+        self._config = config
+        self._values: List[Any] = [None] * len(_FIELD_KEYS)
+        self._dirty = bytearray(len(_FIELD_KEYS))
+        self._unapplied = bytearray(len(_FIELD_KEYS))
+        self._widgets: List[Optional[ui.element]] = [None] * len(_FIELD_KEYS)
+        self._on_change = on_change
+
+    @property
+    def config(self) -> Any:
+        """Configuration object the buffer reads initial values from and applies to."""
+        return self._config
+
+    def _store(self, key: str, value: Any) -> None:
+        index = _FIELD_ID[key]
+        self._values[index] = value
+        self._dirty[index] = 1
+        self._unapplied[index] = 1
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._store(key, value)
+        if self._on_change is not None:
+            self._on_change()
+
+    def __bool__(self) -> bool:
+        return any(self._dirty)
+
+    def update(self, changes: Dict[str, Any]) -> None:
+        """Mark several fields changed at once, with one on_change call."""
+        for key, value in changes.items():
+            self._store(key, value)
+        if changes and self._on_change is not None:
+            self._on_change()
+
+    def watch(self, key: str, widget: ui.element) -> None:
+        """Register the widget that edits a field, for commit().
+
+        The widget's initial value becomes the field's known value unless
+        the field already has an edit, so commit() can ignore no-op changes.
+        """
+        index = _FIELD_ID[key]
+        self._widgets[index] = widget
+        if not self._dirty[index]:
+            self._values[index] = _COERCERS.get(key, _same)(widget.value)
+
+    def widget(self, key: str) -> Optional[ui.element]:
+        """Return the widget watched for a field, if it has been built."""
+        return self._widgets[_FIELD_ID[key]]
+
+    def commit(self, key: str) -> None:
+        """Record a watched field's current widget value as a pending change.
+
+        Keys that are unknown or not watched (e.g. from a stale client event)
+        are ignored, as are values equal to the field's known value.
+        """
+        index = _FIELD_ID.get(key)
+        widget = self._widgets[index] if index is not None else None
+        if widget is None:
+            return
+        value = _COERCERS.get(key, _same)(widget.value)
+        # Focusing a field and leaving it unchanged still fires change
+        if value == self._values[index]:
+            return
+        self[key] = value
+
+    def apply(self) -> None:
+        """Write fields edited since the last apply to the config object."""
+        config = self._config
+        values = self._values
+        for index, unapplied in enumerate(self._unapplied):
+            if unapplied:
+                setattr(config, _FIELD_KEYS[index], values[index])
+        self._unapplied = bytearray(len(_FIELD_KEYS))
+
+    def drain(self) -> Dict[str, Any]:
+        """Return the changed fields as a dict and reset the buffer."""
+        values = self._values
+        changes = {
+            _FIELD_KEYS[index]: values[index]
+            for index, dirty in enumerate(self._dirty) if dirty
+        }
+        self._dirty = bytearray(len(_FIELD_KEYS))
+        return changes
+
+
 # =============================================================================
 # Mount Section (device + site + driver)
 # =============================================================================
 
 def _build_mount_section(
-    config: Any,
-    pending: Dict[str, Any],
+    pending: _PendingBuffer,
+    state: Optional[TelescopeState] = None,
 ) -> None:
     """Build mount settings section combining device, site, and driver."""
     with ui.column().classes('w-full gap-4'):
         # Connection Settings
-        with ui.expansion('Connection', icon='usb').classes('w-full'):
-            with ui.column().classes('w-full gap-3 p-2'):
-                # Serial port (required) - with dropdown of available ports
-                _field_serial_port(
-                    'Serial Port *',
-                    'dev_port',
-                    config,
-                    pending,
-                    hint='Mount serial port (required)'
-                )
+        _render_schema(_MOUNT_CONNECTION_SCHEMA, pending)
 
         # Site Location
-        with ui.expansion('Site Location', icon='location_on').classes('w-full'):
+        with ui.expansion('Site Location', icon='location_on').classes('w-full') as site_expansion:
             with ui.column().classes('w-full gap-3 p-2'):
                 ui.label(
                     'Coordinates are synced from mount on connect'
                 ).classes('text-xs text-secondary italic')
 
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        lat_input = _field_number(
-                            'Latitude',
-                            'site_latitude',
-                            config,
-                            pending,
-                            min_val=-90,
-                            max_val=90,
-                            precision=6,
-                            suffix='° (+ North)'
-                        )
-                    with ui.column().classes('flex-1'):
-                        lon_input = _field_number(
-                            'Longitude',
-                            'site_longitude',
-                            config,
-                            pending,
-                            min_val=-180,
-                            max_val=180,
-                            precision=6,
-                            suffix='° (+ East)'
-                        )
+                _render_items(_SITE_ITEMS, pending)
+
+                # GPS manager, resolved once and reused by the button timer and
+                # copy_from_gps (retried while GPS is disabled and None)
+                gps_ref = {'mgr': None}
 
-                elev_input = _field_number(
-                    'Elevation',
-                    'site_elevation',
-                    config,
-                    pending,
-                    min_val=0,
-                    max_val=10000,
-                    precision=1,
-                    suffix='meters'
-                )
+                def gps_manager() -> Any:
+                    if gps_ref['mgr'] is None:
+                        from TTS160Global import get_gps_manager
+                        gps_ref['mgr'] = get_gps_manager(_LOG)
+                    return gps_ref['mgr']
+
+                # Last GPS status with its monotonic timestamp, shared by the
+                # button timer and copy_from_gps
+                status_cache = {'time': 0.0, 'status': None}
+
+                def gps_status(ttl: float = GPS_STATUS_TTL) -> Any:
+                    now = time.monotonic()
+                    if now - status_cache['time'] >= ttl:
+                        gps_mgr = gps_manager()
+                        status_cache['status'] = gps_mgr.get_status() if gps_mgr else None
+                        status_cache['time'] = now
+                    return status_cache['status']
 
                 # Copy from GPS button
                 def copy_from_gps():
                     """Copy GPS coordinates to site location fields."""
                     try:
-                        from TTS160Global import get_gps_manager
-                        import logging
-                        gps_mgr = get_gps_manager(logging.getLogger('config'))
-                        if gps_mgr:
-                            status = gps_mgr.get_status()
-                            if status and status.position and status.position.valid:
-                                lat_input.value = status.position.latitude
-                                lon_input.value = status.position.longitude
-                                elev_input.value = status.position.altitude
-                                # Update config and pending changes
-                                pending['site_latitude'] = status.position.latitude
-                                pending['site_longitude'] = status.position.longitude
-                                pending['site_elevation'] = status.position.altitude
-                                setattr(config, 'site_latitude', status.position.latitude)
-                                setattr(config, 'site_longitude', status.position.longitude)
-                                setattr(config, 'site_elevation', status.position.altitude)
-                                ui.notify('Copied GPS coordinates', type='positive')
-                            else:
-                                ui.notify('GPS fix not available', type='warning')
+                        status = gps_status()
+                        if status and status.position and status.position.valid:
+                            position = status.position
+                            updates = {
+                                'site_latitude': position.latitude,
+                                'site_longitude': position.longitude,
+                                'site_elevation': position.altitude,
+                            }
+                            # Update pending changes and inputs in one pass;
+                            # NiceGUI sends the input updates together when the handler returns
+                            pending.update(updates)
+                            for key, value in updates.items():
+                                pending.widget(key).value = value
+                            ui.notify('Copied GPS coordinates', type='positive')
+                        else:
+                            ui.notify('GPS fix not available', type='warning')
                     except Exception as e:
                         ui.notify(f'Error: {e}', type='negative')
 
                 def check_gps_available() -> bool:
                     """Check if GPS has a valid fix."""
                     try:
-                        from TTS160Global import get_gps_manager
-                        import logging
-                        gps_mgr = get_gps_manager(logging.getLogger('config'))
-                        if gps_mgr:
-                            status = gps_mgr.get_status()
-                            if status and status.position:
-                                return status.position.valid
+                        status = gps_status()
+                        if status and status.position:
+                            return status.position.valid
                     except Exception:
                         pass
                     return False
@@ -210,83 +668,47 @@ def _build_mount_section(
                         on_click=copy_from_gps
                     ).props('outline')
 
-                    # Update button state based on GPS availability
-                    def update_gps_button():
-                        if check_gps_available():
+                    # Update button state based on GPS availability, only on change
+                    gps_available = {'value': None}
+
+                    def set_gps_button(available: bool):
+                        if available == gps_available['value']:
+                            return
+                        gps_available['value'] = available
+                        if available:
                             gps_btn.enable()
-                            gps_btn.props(remove='disable')
                         else:
                             gps_btn.disable()
 
+                    def update_gps_button():
+                        set_gps_button(check_gps_available())
+
                     update_gps_button()
 
-                    # Set up periodic refresh of button state
-                    ui.timer(2.0, update_gps_button)
+                    # Fix changes are pushed through state by the data service;
+                    # the timer is only a fallback, and runs while the section is open
+                    if state is not None:
+                        state.add_listener(
+                            lambda field, value: set_gps_button(bool(value)),
+                            field_name='gps_fix',
+                            owner=site_expansion,
+                        )
+                        refresh_interval = GPS_FALLBACK_INTERVAL
+                    else:
+                        refresh_interval = GPS_POLL_INTERVAL
+                    gps_timer = ui.timer(refresh_interval, update_gps_button, active=False)
+
+                    def on_site_toggle(e):
+                        if e.args:
+                            update_gps_button()
+                            gps_timer.activate()
+                        else:
+                            gps_timer.deactivate()
+
+                    site_expansion.on('update:model-value', on_site_toggle)
 
         # Driver Settings
-        with ui.expansion('Driver Settings', icon='settings').classes('w-full'):
-            with ui.column().classes('w-full gap-3 p-2'):
-                _field_switch(
-                    'Sync time on connect *',
-                    'sync_time_on_connect',
-                    config,
-                    pending,
-                    hint='Set mount time from computer when connecting'
-                )
-
-                _field_number(
-                    'Slew settle time *',
-                    'slew_settle_time',
-                    config,
-                    pending,
-                    min_val=0,
-                    max_val=30,
-                    precision=0,
-                    suffix='seconds'
-                )
-
-                ui.separator()
-                ui.label('Pulse Guide Settings').classes('text-sm font-medium')
-
-                _field_switch(
-                    'Equatorial frame',
-                    'pulse_guide_equatorial_frame',
-                    config,
-                    pending,
-                    hint='Move mount in equatorial frame for pulse guides'
-                )
-
-                _field_switch(
-                    'Altitude compensation',
-                    'pulse_guide_altitude_compensation',
-                    config,
-                    pending,
-                    hint='Compensate azimuth pulse length for mount altitude'
-                )
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Max compensation',
-                            'pulse_guide_max_compensation',
-                            config,
-                            pending,
-                            min_val=0,
-                            max_val=5000,
-                            precision=0,
-                            suffix='ms'
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Compensation buffer',
-                            'pulse_guide_compensation_buffer',
-                            config,
-                            pending,
-                            min_val=0,
-                            max_val=500,
-                            precision=0,
-                            suffix='ms'
-                        )
+        _render_schema(_MOUNT_DRIVER_SCHEMA, pending)
 
 
 # =============================================================================
@@ -294,108 +716,11 @@ def _build_mount_section(
 # =============================================================================
 
 def _build_gps_section(
-    config: Any,
-    pending: Dict[str, Any],
+    pending: _PendingBuffer,
 ) -> None:
     """Build GPS settings section."""
     with ui.column().classes('w-full gap-4'):
-        # Core GPS Settings
-        with ui.expansion('GPS Dongle', icon='gps_fixed', value=True).classes(
-            'w-full'
-        ):
-            with ui.column().classes('w-full gap-3 p-2'):
-                _field_switch(
-                    'Enable GPS',
-                    'gps_enabled',
-                    config,
-                    pending,
-                    hint='Enable GPS dongle for automatic location updates'
-                )
-
-                _field_serial_port_with_auto(
-                    'Serial Port',
-                    'gps_port',
-                    config,
-                    pending,
-                    hint='"auto" to scan for GPS, or specific port'
-                )
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_select(
-                            'Baud Rate',
-                            'gps_baudrate',
-                            config,
-                            pending,
-                            options={
-                                4800: '4800',
-                                9600: '9600',
-                                19200: '19200',
-                                38400: '38400'
-                            }
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Read timeout',
-                            'gps_read_timeout',
-                            config,
-                            pending,
-                            min_val=0.5,
-                            max_val=10,
-                            precision=1,
-                            suffix='sec'
-                        )
-
-        # GPS Quality Settings
-        with ui.expansion('Fix Requirements', icon='signal_cellular_alt').classes(
-            'w-full'
-        ):
-            with ui.column().classes('w-full gap-3 p-2'):
-                _field_select(
-                    'Minimum fix quality',
-                    'gps_min_fix_quality',
-                    config,
-                    pending,
-                    options={1: 'GPS (1)', 2: 'DGPS (2)', 4: 'RTK Fixed (4)'}
-                )
-
-                _field_number(
-                    'Minimum satellites',
-                    'gps_min_satellites',
-                    config,
-                    pending,
-                    min_val=1,
-                    max_val=20,
-                    precision=0
-                )
-
-        # GPS Behavior
-        with ui.expansion('Behavior', icon='tune').classes('w-full'):
-            with ui.column().classes('w-full gap-3 p-2'):
-                _field_switch(
-                    'Push location on connect',
-                    'gps_push_on_connect',
-                    config,
-                    pending,
-                    hint='Send GPS location to mount when telescope connects'
-                )
-
-                _field_input(
-                    'Location name',
-                    'gps_location_name',
-                    config,
-                    pending,
-                    placeholder='GPS',
-                    hint='Name sent to mount (max 10 chars)'
-                )
-
-                _field_switch(
-                    'Verbose logging',
-                    'gps_verbose_logging',
-                    config,
-                    pending,
-                    hint='Log NMEA sentences for debugging'
-                )
+        _render_schema(_GPS_SCHEMA, pending)
 
 
 # =============================================================================
@@ -403,437 +728,12 @@ def _build_gps_section(
 # =============================================================================
 
 def _build_alignment_section(
-    config: Any,
-    pending: Dict[str, Any],
+    pending: _PendingBuffer,
+    state: Optional[TelescopeState] = None,
 ) -> None:
     """Build alignment monitor settings section."""
     with ui.column().classes('w-full gap-4'):
-        # Core Settings
-        with ui.expansion(
-            'Alignment Monitor', icon='center_focus_strong', value=True
-        ).classes('w-full'):
-            with ui.column().classes('w-full gap-3 p-2'):
-                _field_switch(
-                    'Enable alignment monitor',
-                    'alignment_enabled',
-                    config,
-                    pending,
-                    hint='Enable plate solving for pointing accuracy monitoring'
-                )
-
-                _field_number(
-                    'Measurement interval',
-                    'alignment_interval',
-                    config,
-                    pending,
-                    min_val=5,
-                    max_val=600,
-                    precision=0,
-                    suffix='seconds'
-                )
-
-                _field_number(
-                    'Error warning threshold',
-                    'alignment_error_threshold',
-                    config,
-                    pending,
-                    min_val=1,
-                    max_val=600,
-                    precision=0,
-                    suffix='arcsec'
-                )
-
-                _field_switch(
-                    'Verbose logging',
-                    'alignment_verbose_logging',
-                    config,
-                    pending
-                )
-
-        # Camera Settings
-        with ui.expansion('Camera Source', icon='camera').classes('w-full'):
-            with ui.column().classes('w-full gap-3 p-2'):
-                _field_select(
-                    'Camera source',
-                    'alignment_camera_source',
-                    config,
-                    pending,
-                    options={'alpaca': 'Alpaca', 'zwo': 'ZWO Native'}
-                )
-
-                ui.separator()
-                ui.label('Alpaca Camera Settings').classes('text-sm font-medium')
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_input(
-                            'Server address',
-                            'alignment_camera_address',
-                            config,
-                            pending,
-                            placeholder='127.0.0.1'
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Port',
-                            'alignment_camera_port',
-                            config,
-                            pending,
-                            min_val=1,
-                            max_val=65535,
-                            precision=0
-                        )
-
-                _field_number(
-                    'Device number',
-                    'alignment_camera_device',
-                    config,
-                    pending,
-                    min_val=0,
-                    max_val=10,
-                    precision=0
-                )
-
-                ui.separator()
-                ui.label('ZWO Native Settings').classes('text-sm font-medium')
-
-                _field_number(
-                    'Camera ID',
-                    'zwo_camera_id',
-                    config,
-                    pending,
-                    min_val=0,
-                    max_val=10,
-                    precision=0,
-                    hint='Camera index (0 for first ZWO camera)'
-                )
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Exposure',
-                            'zwo_exposure_ms',
-                            config,
-                            pending,
-                            min_val=1,
-                            max_val=60000,
-                            precision=0,
-                            suffix='ms'
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Gain',
-                            'zwo_gain',
-                            config,
-                            pending,
-                            min_val=0,
-                            max_val=500,
-                            precision=0
-                        )
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_select(
-                            'Binning',
-                            'zwo_binning',
-                            config,
-                            pending,
-                            options={1: '1x1', 2: '2x2', 4: '4x4'}
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_select(
-                            'Image type',
-                            'zwo_image_type',
-                            config,
-                            pending,
-                            options={
-                                'RAW8': 'RAW8',
-                                'RAW16': 'RAW16',
-                                'RGB24': 'RGB24',
-                                'Y8': 'Y8'
-                            }
-                        )
-
-        # Capture Settings
-        with ui.expansion('Capture Settings', icon='photo_camera').classes('w-full'):
-            with ui.column().classes('w-full gap-3 p-2'):
-                _field_number(
-                    'Exposure time',
-                    'alignment_exposure_time',
-                    config,
-                    pending,
-                    min_val=0.1,
-                    max_val=60,
-                    precision=1,
-                    suffix='seconds'
-                )
-
-                _field_select(
-                    'Binning',
-                    'alignment_binning',
-                    config,
-                    pending,
-                    options={1: '1x1', 2: '2x2', 4: '4x4'}
-                )
-
-        # Plate Solving Settings
-        with ui.expansion('Plate Solving', icon='auto_fix_high').classes('w-full'):
-            with ui.column().classes('w-full gap-3 p-2'):
-                _field_number(
-                    'Field of view estimate',
-                    'alignment_fov_estimate',
-                    config,
-                    pending,
-                    min_val=0.1,
-                    max_val=30,
-                    precision=2,
-                    suffix='degrees'
-                )
-
-                _field_number(
-                    'Detection threshold',
-                    'alignment_detection_threshold',
-                    config,
-                    pending,
-                    min_val=1,
-                    max_val=20,
-                    precision=1,
-                    suffix='sigma'
-                )
-
-                _field_number(
-                    'Maximum stars',
-                    'alignment_max_stars',
-                    config,
-                    pending,
-                    min_val=10,
-                    max_val=200,
-                    precision=0
-                )
-
-                _field_input(
-                    'Database path',
-                    'alignment_database_path',
-                    config,
-                    pending,
-                    placeholder='tetra3_database.npz',
-                    hint='Path to tetra3 star pattern database'
-                )
-
-        # V1 Decision Engine Thresholds
-        with ui.expansion('V1 Decision Thresholds', icon='rule').classes('w-full'):
-            with ui.column().classes('w-full gap-3 p-2'):
-                ui.label('Error Thresholds (arcseconds)').classes(
-                    'text-sm font-medium'
-                )
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Ignore below',
-                            'alignment_error_ignore',
-                            config,
-                            pending,
-                            min_val=0,
-                            max_val=120,
-                            precision=0,
-                            hint='No action taken'
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Sync above',
-                            'alignment_error_sync',
-                            config,
-                            pending,
-                            min_val=30,
-                            max_val=300,
-                            precision=0,
-                            hint='Trigger sync'
-                        )
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Concern above',
-                            'alignment_error_concern',
-                            config,
-                            pending,
-                            min_val=60,
-                            max_val=600,
-                            precision=0,
-                            hint='Evaluate alignment'
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Max error',
-                            'alignment_error_max',
-                            config,
-                            pending,
-                            min_val=120,
-                            max_val=1200,
-                            precision=0,
-                            hint='Force action + health event'
-                        )
-
-        # V1 Geometry Thresholds
-        with ui.expansion('V1 Geometry Thresholds', icon='category').classes(
-            'w-full'
-        ):
-            with ui.column().classes('w-full gap-3 p-2'):
-                ui.label('Determinant Quality (0-1)').classes('text-sm font-medium')
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Excellent',
-                            'alignment_det_excellent',
-                            config,
-                            pending,
-                            min_val=0,
-                            max_val=1,
-                            precision=2,
-                            hint='Protect this geometry'
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Good',
-                            'alignment_det_good',
-                            config,
-                            pending,
-                            min_val=0,
-                            max_val=1,
-                            precision=2,
-                            hint='Be selective'
-                        )
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Marginal',
-                            'alignment_det_marginal',
-                            config,
-                            pending,
-                            min_val=0,
-                            max_val=1,
-                            precision=2,
-                            hint='Seek improvement'
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Min improvement',
-                            'alignment_det_improvement_min',
-                            config,
-                            pending,
-                            min_val=0,
-                            max_val=0.5,
-                            precision=2,
-                            hint='To justify replacement'
-                        )
-
-        # V1 Angular Constraints
-        with ui.expansion('V1 Angular Constraints', icon='straighten').classes(
-            'w-full'
-        ):
-            with ui.column().classes('w-full gap-3 p-2'):
-                ui.label('Distances (degrees)').classes('text-sm font-medium')
-
-                _field_number(
-                    'Minimum separation',
-                    'alignment_min_separation',
-                    config,
-                    pending,
-                    min_val=1,
-                    max_val=90,
-                    precision=0,
-                    hint='Between alignment points'
-                )
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Refresh radius',
-                            'alignment_refresh_radius',
-                            config,
-                            pending,
-                            min_val=1,
-                            max_val=45,
-                            precision=0,
-                            hint='For refresh logic'
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'Scale radius',
-                            'alignment_scale_radius',
-                            config,
-                            pending,
-                            min_val=1,
-                            max_val=90,
-                            precision=0,
-                            hint='Error weight falloff'
-                        )
-
-                _field_number(
-                    'Refresh error threshold',
-                    'alignment_refresh_error_threshold',
-                    config,
-                    pending,
-                    min_val=10,
-                    max_val=300,
-                    precision=0,
-                    suffix='arcsec'
-                )
-
-        # V1 Lockout and Health
-        with ui.expansion('V1 Lockout & Health', icon='timer').classes('w-full'):
-            with ui.column().classes('w-full gap-3 p-2'):
-                ui.label('Lockout Periods (seconds)').classes('text-sm font-medium')
-
-                with ui.row().classes('w-full gap-4'):
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'After alignment',
-                            'alignment_lockout_post_align',
-                            config,
-                            pending,
-                            min_val=0,
-                            max_val=300,
-                            precision=0
-                        )
-                    with ui.column().classes('flex-1'):
-                        _field_number(
-                            'After sync',
-                            'alignment_lockout_post_sync',
-                            config,
-                            pending,
-                            min_val=0,
-                            max_val=60,
-                            precision=0
-                        )
-
-                ui.separator()
-                ui.label('Health Monitoring').classes('text-sm font-medium')
-
-                _field_number(
-                    'Health window',
-                    'alignment_health_window',
-                    config,
-                    pending,
-                    min_val=60,
-                    max_val=7200,
-                    precision=0,
-                    suffix='seconds'
-                )
-
-                _field_number(
-                    'Alert threshold',
-                    'alignment_health_alert_threshold',
-                    config,
-                    pending,
-                    min_val=1,
-                    max_val=20,
-                    precision=0,
-                    hint='Events in window to trigger alert'
-                )
+        _render_schema(_ALIGNMENT_SCHEMA, pending, state)
 
 
 # =============================================================================
@@ -845,7 +745,7 @@ def _build_gui_section(
     state: Optional[TelescopeState],
     on_theme_change: Callable[[str], None],
     on_disclosure_change: Callable[[int], None],
-    pending: Dict[str, Any],
+    pending: _PendingBuffer,
 ) -> None:
     """Build GUI preferences section."""
     with ui.column().classes('w-full gap-4'):
@@ -857,13 +757,9 @@ def _build_gui_section(
                     ui.label('Theme').classes('text-sm')
                     current_theme = state.current_theme if state else 'dark'
                     ui.select(
-                        options={
-                            'light': 'Light',
-                            'dark': 'Dark',
-                            'astronomy': 'Astronomy (Red)',
-                        },
+                        options=_THEME_OPTIONS,
                         value=current_theme,
-                        on_change=lambda e: on_theme_change(e.value)
+                        on_change=partial(_pass_value, on_theme_change)
                     ).classes('w-full')
 
                 # Disclosure level
@@ -871,13 +767,9 @@ def _build_gui_section(
                     ui.label('Detail Level').classes('text-sm')
                     current_level = state.disclosure_level.value if state else 1
                     ui.select(
-                        options={
-                            1: 'Basic',
-                            2: 'Expanded',
-                            3: 'Advanced',
-                        },
+                        options=_DISCLOSURE_OPTIONS,
                         value=current_level,
-                        on_change=lambda e: on_disclosure_change(e.value)
+                        on_change=partial(_pass_value, on_disclosure_change)
                     ).classes('w-full')
 
 
@@ -885,115 +777,126 @@ def _build_gui_section(
 # Field Builder Helpers
 # =============================================================================
 
+def _quote_prop(value: str) -> str:
+    """Quote a string for a .props() value, escaping any embedded quotes."""
+    return json.dumps(value)
+
+
+def _pass_value(callback: Callable[[Any], None], e: Any) -> None:
+    """Forward a value-change event's new value to a callback."""
+    callback(e.value)
+
+
 def _field_input(
     label: str,
     prop_name: str,
-    config: Any,
-    pending: Dict[str, Any],
+    pending: _PendingBuffer,
     placeholder: str = '',
     hint: str = '',
 ) -> ui.input:
-    """Create a text input field bound to config property."""
-    with ui.column().classes('w-full gap-1'):
-        ui.label(label).classes('text-sm')
-        inp = ui.input(
-            value=str(getattr(config, prop_name, '')),
-            placeholder=placeholder,
-        ).classes('w-full')
-        if hint:
-            ui.label(hint).classes('text-xs text-secondary')
+    """Create a text input field bound to config property.
+
+    The label and hint are rendered by the Quasar field itself.
+    """
+    inp = ui.input(
+        label=label,
+        value=str(getattr(pending.config, prop_name, '')),
+        placeholder=placeholder,
+    ).classes('w-full').props(f'debounce={INPUT_DEBOUNCE_MS}')
+    if hint:
+        inp.props(f'hint={_quote_prop(hint)}')
 
-        def on_change():
-            pending[prop_name] = inp.value
-            setattr(config, prop_name, inp.value)
+    # Committed by the panel's delegated change listener
+    inp.props(f'data-prop={prop_name}')
+    pending.watch(prop_name, inp)
+    return inp
 
-        inp.on('change', on_change)
-        return inp
+
+@lru_cache(maxsize=None)
+def _range_rule(min_val: float, max_val: float) -> str:
+    """Return a Quasar rules expression accepting [min_val, max_val] or empty."""
+    return (
+        f'[v => v === null || v === "" || (v >= {min_val} && v <= {max_val}) '
+        f'|| "Must be {min_val} to {max_val}"]'
+    )
 
 
 def _field_number(
     label: str,
     prop_name: str,
-    config: Any,
-    pending: Dict[str, Any],
+    pending: _PendingBuffer,
     min_val: float = None,
     max_val: float = None,
     precision: int = 1,
     suffix: str = '',
     hint: str = '',
 ) -> ui.number:
-    """Create a number input field bound to config property."""
-    with ui.column().classes('w-full gap-1'):
-        display_label = f'{label} ({suffix})' if suffix else label
-        ui.label(display_label).classes('text-sm')
-        fmt = f'%.{precision}f'
-        inp = ui.number(
-            value=getattr(config, prop_name, 0),
-            format=fmt,
-            min=min_val,
-            max=max_val,
-        ).classes('w-full')
-        if hint:
-            ui.label(hint).classes('text-xs text-secondary')
-
-        def on_change():
-            val = inp.value
-            if precision == 0:
-                val = int(val) if val is not None else 0
-            pending[prop_name] = val
-            setattr(config, prop_name, val)
-
-        inp.on('change', on_change)
-        return inp
+    """Create a number input field bound to config property.
+
+    The label and hint are rendered by the Quasar field itself.
+    """
+    display_label = f'{label} ({suffix})' if suffix else label
+    fmt = _FMT.get(precision) or f'%.{precision}f'
+    inp = ui.number(
+        label=display_label,
+        value=getattr(pending.config, prop_name, 0),
+        format=fmt,
+        min=min_val,
+        max=max_val,
+    ).classes('w-full').props(f'debounce={INPUT_DEBOUNCE_MS}')
+    if hint:
+        inp.props(f'hint={_quote_prop(hint)}')
+    if min_val is not None and max_val is not None:
+        # Flag out-of-range entries in the browser while typing
+        inp.props(f':rules={_quote_prop(_range_rule(min_val, max_val))} lazy-rules')
+
+    # Committed by the panel's delegated change listener
+    inp.props(f'data-prop={prop_name}')
+    pending.watch(prop_name, inp)
+    return inp
 
 
 def _field_switch(
     label: str,
     prop_name: str,
-    config: Any,
-    pending: Dict[str, Any],
+    pending: _PendingBuffer,
     hint: str = '',
 ) -> ui.switch:
-    """Create a switch field bound to config property."""
-    with ui.row().classes('w-full items-center justify-between'):
-        with ui.column().classes('gap-0'):
-            ui.label(label).classes('text-sm')
-            if hint:
-                ui.label(hint).classes('text-xs text-secondary')
-        sw = ui.switch(value=getattr(config, prop_name, False))
+    """Create a switch field bound to config property.
 
-        def on_change(e):
-            pending[prop_name] = e.value
-            setattr(config, prop_name, e.value)
+    The label is the switch's own text; the hint is shown as a tooltip.
+    """
+    sw = ui.switch(label, value=getattr(pending.config, prop_name, False)).classes('w-full')
+    if hint:
+        sw.tooltip(hint)
 
-        sw.on('update:model-value', on_change)
-        return sw
+    pending.watch(prop_name, sw)
+    sw.on('update:model-value', partial(pending.commit, prop_name))
+    return sw
 
 
 def _field_select(
     label: str,
     prop_name: str,
-    config: Any,
-    pending: Dict[str, Any],
+    pending: _PendingBuffer,
     options: Dict[Any, str],
     hint: str = '',
 ) -> ui.select:
-    """Create a select field bound to config property."""
-    with ui.column().classes('w-full gap-1'):
-        ui.label(label).classes('text-sm')
-        sel = ui.select(
-            options=options,
-            value=getattr(config, prop_name, list(options.keys())[0]),
-        ).classes('w-full')
-        if hint:
-            ui.label(hint).classes('text-xs text-secondary')
+    """Create a select field bound to config property.
 
-        def on_change(e):
-            pending[prop_name] = e.value
-            setattr(config, prop_name, e.value)
+    The label and hint are rendered by the Quasar field itself.
+    """
+    sel = ui.select(
+        options=options,
+        label=label,
+        value=getattr(pending.config, prop_name, next(iter(options))),
+    ).classes('w-full')
+    if hint:
+        sel.props(f'hint={_quote_prop(hint)}')
 
-        sel.on('update:model-value', on_change)
-        return sel
+    pending.watch(prop_name, sel)
+    sel.on('update:model-value', partial(pending.commit, prop_name))
+    return sel
 
 
 def _get_serial_ports() -> Dict[str, str]:
@@ -1021,64 +924,57 @@ def _get_serial_ports() -> Dict[str, str]:
 def _field_serial_port(
     label: str,
     prop_name: str,
-    config: Any,
-    pending: Dict[str, Any],
+    pending: _PendingBuffer,
     hint: str = '',
 ) -> ui.element:
     """Create a serial port dropdown with refresh button.
 
     Shows available COM ports with hardware descriptions.
     """
-    with ui.column().classes('w-full gap-1') as container:
-        ui.label(label).classes('text-sm')
-
-        with ui.row().classes('w-full gap-2 items-center'):
-            # Get initial port list
-            ports = _get_serial_ports()
-
-            # Add current config value if not in list (might be disconnected)
-            current_value = getattr(config, prop_name, '')
-            if current_value and current_value not in ports:
-                ports[current_value] = f"{current_value} (not found)"
-
-            # If no ports found, add placeholder
-            if not ports:
-                ports[''] = '(No ports found)'
-
-            # Create dropdown
-            sel = ui.select(
-                options=ports,
-                value=current_value if current_value in ports else '',
-                with_input=True,  # Allow typing custom port
-            ).classes('flex-grow')
-            sel.props('dense')
-
-            def on_change(e):
-                value = e.value if e.value else ''
-                pending[prop_name] = value
-                setattr(config, prop_name, value)
-
-            sel.on('update:model-value', on_change)
-
-            # Refresh button
-            def refresh_ports():
-                new_ports = _get_serial_ports()
-                current = sel.value
-                if current and current not in new_ports:
-                    new_ports[current] = f"{current} (not found)"
-                if not new_ports:
-                    new_ports[''] = '(No ports found)'
-                sel.options = new_ports
-                sel.update()
-                ui.notify(f'Found {len([p for p in new_ports if p])} port(s)', type='info')
-
-            ui.button(
-                icon='refresh',
-                on_click=refresh_ports
-            ).props('flat dense').tooltip('Refresh port list')
-
-        if hint:
-            ui.label(hint).classes('text-xs text-secondary')
+    with ui.row().classes('w-full gap-2 items-center') as container:
+        # Get initial port list
+        ports = _get_serial_ports()
+
+        # Add current config value if not in list (might be disconnected)
+        current_value = getattr(pending.config, prop_name, '')
+        if current_value and current_value not in ports:
+            ports[current_value] = f"{current_value} (not found)"
+
+        # If no ports found, add placeholder
+        if not ports:
+            ports[''] = '(No ports found)'
+
+        # Create dropdown
+        sel = ui.select(
+            options=ports,
+            value=current_value if current_value in ports else '',
+            label=label,
+            with_input=True,  # Allow typing custom port
+        ).classes('flex-grow')
+        sel.props('dense')
+
+        pending.watch(prop_name, sel)
+        sel.on('update:model-value', partial(pending.commit, prop_name))
+
+        # Refresh button
+        def refresh_ports():
+            new_ports = _get_serial_ports()
+            current = sel.value
+            if current and current not in new_ports:
+                new_ports[current] = f"{current} (not found)"
+            if not new_ports:
+                new_ports[''] = '(No ports found)'
+            sel.options = new_ports
+            sel.update()
+            ui.notify(f'Found {len([p for p in new_ports if p])} port(s)', type='info')
+
+        ui.button(
+            icon='refresh',
+            on_click=refresh_ports
+        ).props('flat dense').tooltip('Refresh port list')
+
+    if hint:
+        sel.props(f'hint={_quote_prop(hint)}')
 
     return container
 
@@ -1086,60 +982,147 @@ def _field_serial_port(
 def _field_serial_port_with_auto(
     label: str,
     prop_name: str,
-    config: Any,
-    pending: Dict[str, Any],
+    pending: _PendingBuffer,
     hint: str = '',
 ) -> ui.element:
     """Create a serial port dropdown with 'auto' option and refresh button.
 
     Like _field_serial_port but includes 'auto' for GPS auto-detection.
     """
-    with ui.column().classes('w-full gap-1') as container:
-        ui.label(label).classes('text-sm')
-
-        with ui.row().classes('w-full gap-2 items-center'):
-            # Get initial port list with 'auto' option first
-            ports = {'auto': 'auto (scan for device)'}
-            ports.update(_get_serial_ports())
-
-            # Add current config value if not in list
-            current_value = getattr(config, prop_name, 'auto')
-            if current_value and current_value not in ports:
-                ports[current_value] = f"{current_value} (not found)"
-
-            # Create dropdown
-            sel = ui.select(
-                options=ports,
-                value=current_value if current_value in ports else 'auto',
-                with_input=True,  # Allow typing custom port
-            ).classes('flex-grow')
-            sel.props('dense')
-
-            def on_change(e):
-                value = e.value if e.value else 'auto'
-                pending[prop_name] = value
-                setattr(config, prop_name, value)
-
-            sel.on('update:model-value', on_change)
-
-            # Refresh button
-            def refresh_ports():
-                new_ports = {'auto': 'auto (scan for device)'}
-                new_ports.update(_get_serial_ports())
-                current = sel.value
-                if current and current not in new_ports:
-                    new_ports[current] = f"{current} (not found)"
-                sel.options = new_ports
-                sel.update()
-                port_count = len([p for p in new_ports if p and p != 'auto'])
-                ui.notify(f'Found {port_count} port(s)', type='info')
-
-            ui.button(
-                icon='refresh',
-                on_click=refresh_ports
-            ).props('flat dense').tooltip('Refresh port list')
-
-        if hint:
-            ui.label(hint).classes('text-xs text-secondary')
+    with ui.row().classes('w-full gap-2 items-center') as container:
+        # Get initial port list with 'auto' option first
+        ports = {'auto': 'auto (scan for device)'}
+        ports.update(_get_serial_ports())
+
+        # Add current config value if not in list
+        current_value = getattr(pending.config, prop_name, 'auto')
+        if current_value and current_value not in ports:
+            ports[current_value] = f"{current_value} (not found)"
+
+        # Create dropdown
+        sel = ui.select(
+            options=ports,
+            value=current_value if current_value in ports else 'auto',
+            label=label,
+            with_input=True,  # Allow typing custom port
+        ).classes('flex-grow')
+        sel.props('dense')
+
+        pending.watch(prop_name, sel)
+        sel.on('update:model-value', partial(pending.commit, prop_name))
+
+        # Refresh button
+        def refresh_ports():
+            new_ports = {'auto': 'auto (scan for device)'}
+            new_ports.update(_get_serial_ports())
+            current = sel.value
+            if current and current not in new_ports:
+                new_ports[current] = f"{current} (not found)"
+            sel.options = new_ports
+            sel.update()
+            port_count = len([p for p in new_ports if p and p != 'auto'])
+            ui.notify(f'Found {port_count} port(s)', type='info')
+
+        ui.button(
+            icon='refresh',
+            on_click=refresh_ports
+        ).props('flat dense').tooltip('Refresh port list')
+
+    if hint:
+        sel.props(f'hint={_quote_prop(hint)}')
 
     return container
+
+
+# =============================================================================
+# Schema Renderer
+# =============================================================================
+
+# Field builders by schema kind
+_FIELD_DISPATCH: Dict[str, Callable[..., ui.element]] = {
+    'input': _field_input,
+    'number': _field_number,
+    'switch': _field_switch,
+    'select': _field_select,
+    'serial_port': _field_serial_port,
+    'serial_port_auto': _field_serial_port_with_auto,
+}
+
+
+def _render_schema(
+    schema: Tuple,
+    pending: _PendingBuffer,
+    state: Optional[TelescopeState] = None,
+) -> None:
+    """Render a section schema as a sequence of expansions.
+
+    Expansions that start open are filled immediately; collapsed ones are
+    filled the first time they are opened. Expansions listed in
+    _EXPANSION_MIN_LEVEL are shown only at that disclosure level or above.
+
+    Args:
+        schema: Tuple of (title, icon, open, items) expansion specs.
+        pending: Pending changes buffer, which also carries the config.
+        state: Optional state for the current disclosure level.
+    """
+    for title, icon, is_open, items in schema:
+        with ui.expansion(title, icon=icon, value=is_open).classes('w-full') as expansion:
+            body = ui.column().classes('w-full gap-3 p-2')
+        min_level = _EXPANSION_MIN_LEVEL.get(title)
+        if min_level is not None and state is not None:
+            _show_from_level(expansion, state, min_level)
+        if is_open:
+            with body:
+                _render_items(items, pending)
+        else:
+            _render_on_first_open(expansion, body, items, pending)
+
+
+def _render_on_first_open(
+    expansion: ui.expansion,
+    body: ui.element,
+    items: Tuple,
+    pending: _PendingBuffer,
+) -> None:
+    """Fill an expansion body with its items when it is first opened."""
+    built = {'value': False}
+
+    def on_toggle(e):
+        if e.args and not built['value']:
+            built['value'] = True
+            with body:
+                _render_items(items, pending)
+
+    expansion.on('update:model-value', on_toggle)
+
+
+def _show_from_level(element: ui.element, state: TelescopeState, min_level: DisclosureLevel) -> None:
+    """Show an element only while the disclosure level is at least min_level."""
+    element.set_visibility(state.disclosure_level.value >= min_level.value)
+    state.add_listener(
+        lambda field, level: element.set_visibility(level.value >= min_level.value),
+        field_name='disclosure_level',
+        owner=element,
+    )
+
+
+def _render_items(items: Tuple, pending: _PendingBuffer) -> None:
+    """Render the items of one expansion."""
+    for item in items:
+        kind = item[0]
+        if kind == 'row':
+            with ui.row().classes('w-full gap-4'):
+                for field in item[1]:
+                    _render_field(field, pending).classes('flex-1')
+        elif kind == 'heading':
+            ui.label(item[1]).classes('text-sm font-medium')
+        elif kind == 'separator':
+            ui.separator()
+        else:
+            _render_field(item, pending)
+
+
+def _render_field(field: Tuple, pending: _PendingBuffer) -> ui.element:
+    """Build one field from its (kind, label, prop_name, kwargs) spec."""
+    kind, label, prop_name, kwargs = field
+    return _FIELD_DISPATCH[kind](label, prop_name, pending, **kwargs)
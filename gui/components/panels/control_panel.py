@@ -6,9 +6,9 @@ Combines control components for telescope operations.
 """
 
 from typing import Any, Callable, Dict
-from nicegui import ui
+from nicegui import run, ui
 
-from ...state import TelescopeState
+from ...state import TelescopeState, format_serial_port
 from ..controls import (
     slew_controls,
     tracking_controls,
@@ -17,6 +17,16 @@ from ..controls import (
 )
 
 
+# Connection card appearance per status:
+# (indicator class, label, button text, button color, button icon)
+_CONNECTION_STYLES = {
+    'connected': ('indicator-ok', 'Connected', 'Disconnect', 'negative', 'link_off'),
+    'error': ('indicator-error', 'Error', 'Retry', 'warning', 'refresh'),
+    'disconnected': ('indicator-inactive', 'Disconnected', 'Connect', 'primary', 'link'),
+}
+_CONNECTION_INDICATOR_CLASSES = 'indicator-ok indicator-error indicator-inactive'
+
+
 def _connection_control(
     state: TelescopeState,
     on_connect: Callable,
@@ -46,55 +56,58 @@ def _connection_control(
             # Connect/Disconnect button
             conn_btn = ui.button().classes('w-32')
 
-            def update_connection():
-                conn_ind.classes(
-                    remove='indicator-ok indicator-error indicator-inactive'
-                )
+            # Status last drawn, so repeated updates with no visible change are skipped
+            rendered = {'value': None}
 
+            def update_connection():
                 if state.connected:
-                    conn_ind.classes(add='indicator-ok')
-                    conn_label.text = 'Connected'
-                    conn_btn.text = 'Disconnect'
-                    conn_btn.props('color=negative')
-                    conn_btn._props['icon'] = 'link_off'
+                    status = 'connected'
                 elif state.connection_error:
-                    conn_ind.classes(add='indicator-error')
-                    conn_label.text = 'Error'
-                    conn_btn.text = 'Retry'
-                    conn_btn.props(remove='color')
-                    conn_btn.props('color=warning')
-                    conn_btn._props['icon'] = 'refresh'
+                    status = 'error'
                 else:
-                    conn_ind.classes(add='indicator-inactive')
-                    conn_label.text = 'Disconnected'
-                    conn_btn.text = 'Connect'
-                    conn_btn.props(remove='color')
-                    conn_btn.props('color=primary')
-                    conn_btn._props['icon'] = 'link'
-
-            def on_btn_click():
+                    status = 'disconnected'
+                if status == rendered['value']:
+                    return
+                rendered['value'] = status
+                ind_cls, label_text, btn_text, btn_color, btn_icon = _CONNECTION_STYLES[status]
+
+                conn_ind.classes(remove=_CONNECTION_INDICATOR_CLASSES, add=ind_cls)
+                conn_label.text = label_text
+                conn_btn.text = btn_text
+                conn_btn.props(f'color={btn_color} icon={btn_icon}')
+
+            async def on_btn_click():
+                # Show the pending action right away; the handshake runs off
+                # the event loop so the page stays responsive meanwhile
                 if state.connected:
-                    on_disconnect()
+                    handler, conn_label.text = on_disconnect, 'Disconnecting...'
                 else:
-                    on_connect()
+                    handler, conn_label.text = on_connect, 'Connecting...'
+                rendered['value'] = None
+                conn_btn.props('loading')
+                conn_btn.disable()
+                try:
+                    await run.io_bound(handler)
+                finally:
+                    conn_btn.props(remove='loading')
+                    conn_btn.enable()
+                    update_connection()
 
             conn_btn.on('click', on_btn_click)
             update_connection()
 
-            def on_change(field, value):
-                if field in ('connected', 'connection_error'):
-                    update_connection()
+            # Both fields often change in the same update; a group listener
+            # redraws the card once for them instead of once per field
+            def on_change(changed):
+                update_connection()
 
-            state.add_listener(on_change)
+            state.add_group_listener(on_change, ('connected', 'connection_error'), owner=container)
 
         # Serial port info
         with ui.row().classes('items-center gap-2'):
             ui.label('Port:').classes('label text-sm')
             port_label = ui.label().classes('mono text-sm')
-            port_label.bind_text_from(
-                state, 'serial_port',
-                lambda p: p if p else 'Not configured'
-            )
+            port_label.bind_text_from(state, 'serial_port', format_serial_port)
 
         # Connection options (only show if config available)
         if config is not None:
@@ -265,20 +278,20 @@ def minimal_control_panel(
             park_btn = ui.button().classes('w-full')
 
             def update_park():
-                park_btn._event_listeners.clear()
+                park_btn.text = 'Unpark' if state.at_park else 'Park'
+
+            def on_park_click():
                 if state.at_park:
-                    park_btn.text = 'Unpark'
-                    park_btn.on('click', unpark)
+                    unpark()
                 else:
-                    park_btn.text = 'Park'
-                    park_btn.on('click', park)
+                    park()
 
+            park_btn.on('click', on_park_click)
             update_park()
 
             def on_change(field, value):
-                if field == 'at_park':
-                    update_park()
+                update_park()
 
-            state.add_listener(on_change)
+            state.add_listener(on_change, field_name='at_park', owner=container)
 
     return container
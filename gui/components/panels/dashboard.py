@@ -6,16 +6,40 @@ Compact summary dashboard showing key telescope info at a glance.
 Always visible above the detail navigation.
 """
 
+from typing import Callable, Optional, Tuple
+
 from nicegui import ui
 
 from ...state import (
     TelescopeState,
     AlignmentState,
+    DisclosureLevel,
     format_ra,
     format_dec,
+    format_angle,
 )
 
 
+# Every variant class an indicator may carry, cleared before the new one is set
+_INDICATOR_VARIANTS = 'indicator-ok indicator-warning indicator-error indicator-inactive indicator-pulse'
+
+# Text color classes the tracking status label may carry
+_STATUS_TEXT_COLORS = 'text-success text-warning text-error'
+
+# Alignment states in which the monitor is actively checking, and the busy subset
+_MONITORING_STATES = frozenset((
+    AlignmentState.MONITORING,
+    AlignmentState.CAPTURING,
+    AlignmentState.SOLVING,
+))
+_BUSY_STATES = frozenset((AlignmentState.CAPTURING, AlignmentState.SOLVING))
+
+
+def _format_pier_side(side: str) -> str:
+    """Abbreviate the pier side to its initial ('?' when unset)."""
+    return side[0].upper() if side else '?'
+
+
 def dashboard(state: TelescopeState) -> ui.element:
     """Compact dashboard showing key status at a glance.
 
@@ -76,28 +100,19 @@ def _position_section(state: TelescopeState) -> ui.element:
             with ui.row().classes('items-baseline gap-1'):
                 ui.label('Alt').classes('dashboard-label-sm')
                 alt_val = ui.label().classes('dashboard-value-sm mono')
-                alt_val.bind_text_from(
-                    state, 'alt_degrees',
-                    lambda d: f"{d:.1f}°"
-                )
+                alt_val.bind_text_from(state, 'alt_degrees', format_angle)
 
             # Az
             with ui.row().classes('items-baseline gap-1'):
                 ui.label('Az').classes('dashboard-label-sm')
                 az_val = ui.label().classes('dashboard-value-sm mono')
-                az_val.bind_text_from(
-                    state, 'az_degrees',
-                    lambda d: f"{d:.1f}°"
-                )
+                az_val.bind_text_from(state, 'az_degrees', format_angle)
 
             # Pier side
             with ui.row().classes('items-baseline gap-1'):
                 ui.label('Pier').classes('dashboard-label-sm')
                 pier_val = ui.label().classes('dashboard-value-sm')
-                pier_val.bind_text_from(
-                    state, 'pier_side',
-                    lambda p: p[0].upper() if p else '?'
-                )
+                pier_val.bind_text_from(state, 'pier_side', _format_pier_side)
 
     return section
 
@@ -113,36 +128,34 @@ def _tracking_section(state: TelescopeState) -> ui.element:
         # Tracking rate (smaller)
         rate_label = ui.label().classes('dashboard-label-sm')
 
-        def update_tracking():
-            track_ind.classes(
-                remove='indicator-ok indicator-warning indicator-error indicator-inactive indicator-pulse'
-            )
+        # Variant last drawn, so updates that change nothing visible are skipped
+        rendered = {'value': None}
 
+        def update_tracking():
             if state.slewing:
-                track_ind.classes(add='indicator-warning indicator-pulse')
-                track_label.text = 'SLEWING'
-                track_label.classes(remove='text-success text-error')
-                track_label.classes(add='text-warning')
-                rate_label.text = ''
+                variant = ('indicator-warning indicator-pulse', 'SLEWING', 'text-warning', '')
             elif state.tracking_enabled:
-                track_ind.classes(add='indicator-ok')
-                track_label.text = 'TRACKING'
-                track_label.classes(remove='text-warning text-error')
-                track_label.classes(add='text-success')
-                rate_label.text = state.tracking_rate.capitalize()
+                variant = ('indicator-ok', 'TRACKING', 'text-success', state.tracking_rate.capitalize())
             else:
-                track_ind.classes(add='indicator-inactive')
-                track_label.text = 'IDLE'
-                track_label.classes(remove='text-success text-warning')
-                rate_label.text = ''
+                variant = ('indicator-inactive', 'IDLE', '', '')
+            if variant == rendered['value']:
+                return
+            rendered['value'] = variant
+            ind_cls, text, text_cls, rate_text = variant
+
+            track_ind.classes(remove=_INDICATOR_VARIANTS, add=ind_cls)
+            track_label.text = text
+            track_label.classes(remove=_STATUS_TEXT_COLORS, add=text_cls)
+            rate_label.text = rate_text
 
         update_tracking()
 
-        def on_tracking_change(field, value):
-            if field in ('slewing', 'tracking_enabled', 'tracking_rate'):
-                update_tracking()
+        def on_tracking_change(changed):
+            update_tracking()
 
-        state.add_listener(on_tracking_change)
+        state.add_group_listener(
+            on_tracking_change, ('slewing', 'tracking_enabled', 'tracking_rate'), owner=section
+        )
 
     return section
 
@@ -155,72 +168,42 @@ def _status_section(state: TelescopeState) -> ui.element:
             conn_ind = ui.element('span').classes('indicator')
             ui.label('Mount').classes('dashboard-indicator-label')
 
-            def update_connection():
-                conn_ind.classes(
-                    remove='indicator-ok indicator-error indicator-inactive'
-                )
+            def connection_variant():
                 if state.connected:
-                    conn_ind.classes(add='indicator-ok')
-                elif state.connection_error:
-                    conn_ind.classes(add='indicator-error')
-                else:
-                    conn_ind.classes(add='indicator-inactive')
-
-            update_connection()
+                    return 'indicator-ok'
+                if state.connection_error:
+                    return 'indicator-error'
+                return 'indicator-inactive'
 
-            def on_conn_change(field, value):
-                if field in ('connected', 'connection_error'):
-                    update_connection()
-
-            state.add_listener(on_conn_change)
+            _bind_indicator(state, conn_ind, ('connected', 'connection_error'), connection_variant, section)
 
         # Park indicator
         with ui.column().classes('items-center gap-0'):
             park_ind = ui.element('span').classes('indicator')
             ui.label('Park').classes('dashboard-indicator-label')
 
-            def update_park():
-                park_ind.classes(
-                    remove='indicator-ok indicator-warning indicator-inactive'
-                )
+            def park_variant():
                 if state.at_park:
-                    park_ind.classes(add='indicator-ok')
-                elif state.at_home:
-                    park_ind.classes(add='indicator-warning')
-                else:
-                    park_ind.classes(add='indicator-inactive')
-
-            update_park()
-
-            def on_park_change(field, value):
-                if field in ('at_park', 'at_home'):
-                    update_park()
+                    return 'indicator-ok'
+                if state.at_home:
+                    return 'indicator-warning'
+                return 'indicator-inactive'
 
-            state.add_listener(on_park_change)
+            _bind_indicator(state, park_ind, ('at_park', 'at_home'), park_variant, section)
 
         # GPS indicator
         with ui.column().classes('items-center gap-0'):
             gps_ind = ui.element('span').classes('indicator')
             ui.label('GPS').classes('dashboard-indicator-label')
 
-            def update_gps():
-                gps_ind.classes(
-                    remove='indicator-ok indicator-warning indicator-error indicator-inactive'
-                )
+            def gps_variant():
                 if state.gps_fix:
-                    gps_ind.classes(add='indicator-ok')
-                elif state.gps_enabled:
-                    gps_ind.classes(add='indicator-warning')
-                else:
-                    gps_ind.classes(add='indicator-inactive')
+                    return 'indicator-ok'
+                if state.gps_enabled:
+                    return 'indicator-warning'
+                return 'indicator-inactive'
 
-            update_gps()
-
-            def on_gps_change(field, value):
-                if field in ('gps_enabled', 'gps_fix'):
-                    update_gps()
-
-            state.add_listener(on_gps_change)
+            _bind_indicator(state, gps_ind, ('gps_enabled', 'gps_fix'), gps_variant, section)
 
         # Alignment indicator (only in expanded+ mode)
         align_container = ui.column().classes('items-center gap-0 disclosure-2')
@@ -228,39 +211,68 @@ def _status_section(state: TelescopeState) -> ui.element:
             align_ind = ui.element('span').classes('indicator')
             ui.label('Align').classes('dashboard-indicator-label')
 
-            def update_alignment():
-                align_ind.classes(
-                    remove='indicator-ok indicator-warning indicator-error indicator-inactive indicator-pulse'
-                )
-                monitoring_states = [
-                    AlignmentState.MONITORING,
-                    AlignmentState.CAPTURING,
-                    AlignmentState.SOLVING,
-                ]
-                if state.alignment_state in monitoring_states:
+            def alignment_variant():
+                if state.alignment_state in _MONITORING_STATES:
                     # Check error level
                     if state.alignment_error_arcsec < 60:
-                        align_ind.classes(add='indicator-ok')
+                        variant = 'indicator-ok'
                     elif state.alignment_error_arcsec < 120:
-                        align_ind.classes(add='indicator-warning')
+                        variant = 'indicator-warning'
                     else:
-                        align_ind.classes(add='indicator-error')
+                        variant = 'indicator-error'
+
+                    if state.alignment_state in _BUSY_STATES:
+                        variant += ' indicator-pulse'
+                    return variant
+                if state.alignment_state == AlignmentState.CONNECTED:
+                    return 'indicator-ok'
+                if state.alignment_state == AlignmentState.ERROR:
+                    return 'indicator-error'
+                return 'indicator-inactive'
+
+            _bind_indicator(
+                state, align_ind, ('alignment_state', 'alignment_error_arcsec'), alignment_variant, section,
+                min_level=DisclosureLevel.EXPANDED,
+            )
 
-                    if state.alignment_state in [AlignmentState.CAPTURING, AlignmentState.SOLVING]:
-                        align_ind.classes(add='indicator-pulse')
-                elif state.alignment_state == AlignmentState.CONNECTED:
-                    align_ind.classes(add='indicator-ok')
-                elif state.alignment_state == AlignmentState.ERROR:
-                    align_ind.classes(add='indicator-error')
-                else:
-                    align_ind.classes(add='indicator-inactive')
+    return section
 
-            update_alignment()
 
-            def on_align_change(field, value):
-                if field in ('alignment_state', 'alignment_error_arcsec'):
-                    update_alignment()
+def _bind_indicator(
+    state: TelescopeState,
+    indicator: ui.element,
+    fields: Tuple[str, ...],
+    variant_for: Callable[[], str],
+    owner: ui.element,
+    min_level: Optional[DisclosureLevel] = None,
+) -> None:
+    """Keep an indicator's variant classes in step with a group of state fields.
 
-            state.add_listener(on_align_change)
+    The indicator is redrawn once per update touching any of the fields, and
+    only when the resolved variant differs from the one already shown.
 
-    return section
+    Args:
+        state: Telescope state instance.
+        indicator: Indicator element to style.
+        fields: State fields the variant depends on.
+        variant_for: Returns the variant classes for the current state.
+        owner: Element whose lifetime bounds the listener.
+        min_level: Disclosure level below which the indicator is hidden by
+            CSS; updates are skipped until the level is reached.
+    """
+    rendered = {'value': None}
+
+    def update(changed=None):
+        if min_level is not None and state.disclosure_level.value < min_level.value:
+            return
+        variant = variant_for()
+        if variant == rendered['value']:
+            return
+        rendered['value'] = variant
+        indicator.classes(remove=_INDICATOR_VARIANTS, add=variant)
+
+    update()
+    if min_level is not None:
+        # Catch up when the indicator is revealed
+        fields = tuple(fields) + ('disclosure_level',)
+    state.add_group_listener(update, fields, owner=owner)
@@ -5,13 +5,34 @@ Diagnostics Panel
 Layer 3 advanced information for debugging and development.
 """
 
+import html
+import json
+from collections import deque
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Optional, Set
 from nicegui import ui
 
 from ...state import TelescopeState
 
 
+# Quiet period before the raw state view is re-serialized (seconds)
+STATE_REFRESH_DELAY = 0.25
+
+# Severity rank per log level, for filtering by integer comparison
+LOG_LEVEL_RANKS = {'DEBUG': 0, 'INFO': 1, 'WARNING': 2, 'ERROR': 3}
+
+# Number of most recent matching entries shown in the log viewer
+LOG_VIEW_ROWS = 100
+
+# Text color class per log level
+LOG_LEVEL_COLORS = {
+    'DEBUG': 'text-secondary',
+    'INFO': 'text-primary',
+    'WARNING': 'text-warning',
+    'ERROR': 'text-error',
+}
+
+
 class LogEntry:
     """Log entry for display."""
 
@@ -26,6 +47,12 @@ class LogEntry:
         self.level = level
         self.message = message
         self.source = source
+        self.rank = LOG_LEVEL_RANKS.get(level, 0)
+        # Display time (HH:MM:SS.mmm), formatted once rather than per render
+        self.time_text = (
+            f'{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}'
+            f'.{timestamp.microsecond // 1000:03d}'
+        )
 
 
 class DiagnosticsPanel:
@@ -44,13 +71,20 @@ class DiagnosticsPanel:
         """
         self._state = state
         self._on_command = on_command
-        self._logs: List[LogEntry] = []
-        self._command_history: List[str] = []
         self._max_logs = 500
+        # Oldest entries fall off the left once the buffer is full
+        self._logs: Deque[LogEntry] = deque(maxlen=self._max_logs)
+        self._max_history = 20
+        self._command_history: Deque[str] = deque(maxlen=self._max_history)
         self._filter_level = 'DEBUG'
+        self._filter_rank = LOG_LEVEL_RANKS[self._filter_level]
 
         self._container: Optional[ui.element] = None
         self._log_container: Optional[ui.element] = None
+        self._log_view: Optional[ui.html] = None
+        self._history_column: Optional[ui.element] = None
+        self._tab_containers: Dict[str, ui.element] = {}
+        self._built_tabs: Set[str] = set()
 
     def build(self) -> ui.element:
         """Build the diagnostics panel UI.
@@ -67,25 +101,38 @@ class DiagnosticsPanel:
                 raw_tab = ui.tab('Raw Data')
                 perf_tab = ui.tab('Performance')
 
-            with ui.tab_panels(tabs, value=log_tab).classes('w-full'):
-                # Logs tab
-                with ui.tab_panel(log_tab):
-                    self._build_log_viewer()
-
-                # Commands tab
-                with ui.tab_panel(commands_tab):
-                    self._build_command_panel()
+            # Tab bodies are built on first activation; each panel holds an
+            # empty mount point until then.
+            with ui.tab_panels(tabs, value=log_tab, on_change=self._on_tab_change).classes('w-full'):
+                for tab in (log_tab, commands_tab, raw_tab, perf_tab):
+                    with ui.tab_panel(tab):
+                        self._tab_containers[tab._props['name']] = ui.column().classes('w-full')
 
-                # Raw data tab
-                with ui.tab_panel(raw_tab):
-                    self._build_raw_data_panel()
-
-                # Performance tab
-                with ui.tab_panel(perf_tab):
-                    self._build_performance_panel()
+            # Logs is the initial tab
+            self._build_tab('Logs')
 
         return self._container
 
+    def _on_tab_change(self, e: Any) -> None:
+        """Build a tab's contents the first time it is shown."""
+        # Client-side changes report the tab name, programmatic ones the tab
+        value = e.value
+        self._build_tab(value if isinstance(value, str) else value._props['name'])
+
+    def _build_tab(self, name: str) -> None:
+        """Build the named tab's contents unless already built."""
+        if name in self._built_tabs or name not in self._tab_containers:
+            return
+        self._built_tabs.add(name)
+        builders = {
+            'Logs': self._build_log_viewer,
+            'Commands': self._build_command_panel,
+            'Raw Data': self._build_raw_data_panel,
+            'Performance': self._build_performance_panel,
+        }
+        with self._tab_containers[name]:
+            builders[name]()
+
     def _build_log_viewer(self) -> None:
         """Build log viewer section."""
         with ui.column().classes('w-full gap-2'):
@@ -103,11 +150,10 @@ class DiagnosticsPanel:
                     on_click=self._clear_logs
                 ).classes('ml-auto').props('flat dense')
 
-            # Log display
+            # Log display, sent as one HTML block rather than a row element
+            # and three labels per entry
             with ui.scroll_area().classes('w-full h-64 bg-surface') as self._log_container:
-                with ui.column().classes('w-full gap-0'):
-                    for entry in self._logs[-100:]:  # Show last 100
-                        self._render_log_entry(entry)
+                self._log_view = ui.html(self._render_log_view()).classes('w-full')
 
     def _build_command_panel(self) -> None:
         """Build command input panel."""
@@ -125,7 +171,7 @@ class DiagnosticsPanel:
                 def send_cmd():
                     if self._on_command and cmd_input.value:
                         self._on_command(cmd_input.value)
-                        self._command_history.append(cmd_input.value)
+                        self._add_history(cmd_input.value)
                         cmd_input.value = ''
 
                 ui.button('Send', on_click=send_cmd).props('dense')
@@ -133,23 +179,42 @@ class DiagnosticsPanel:
             # Command history
             ui.label('History').classes('label mt-2')
             with ui.scroll_area().classes('w-full h-32 bg-surface'):
-                with ui.column().classes('w-full gap-0'):
-                    for cmd in reversed(self._command_history[-20:]):
-                        with ui.row().classes('w-full items-center'):
-                            ui.label(cmd).classes('mono text-xs')
+                with ui.column().classes('w-full gap-0') as self._history_column:
+                    for cmd in reversed(self._command_history):
+                        self._render_history_entry(cmd)
+
+    def _render_history_entry(self, cmd: str) -> ui.element:
+        """Render a single command history row."""
+        with ui.row().classes('w-full items-center') as row:
+            ui.label(cmd).classes('mono text-xs')
+        return row
+
+    def _add_history(self, cmd: str) -> None:
+        """Record a sent command and prepend its row to the history view."""
+        self._command_history.append(cmd)
+        if self._history_column is None:
+            return
+        # Newest first: add one row at the top and drop the oldest past the limit
+        with self._history_column:
+            self._render_history_entry(cmd).move(target_index=0)
+        if len(self._history_column.default_slot.children) > self._max_history:
+            self._history_column.remove(-1)
 
     def _build_raw_data_panel(self) -> None:
         """Build raw data display."""
         with ui.column().classes('w-full gap-2'):
             ui.label('State Data').classes('label')
 
-            # JSON-like display of current state
+            # JSON-like display of current state, as plain preformatted text
+            # (no client-side syntax highlighting on each refresh)
             with ui.scroll_area().classes('w-full h-64 bg-surface'):
-                state_display = ui.code(
-                    language='json'
-                ).classes('w-full')
+                state_display = ui.label().classes('w-full mono text-xs whitespace-pre')
+
+                # Pending refresh, so a burst of requests serializes the state once
+                refresh_timer = {'value': None}
 
                 def update_state_display():
+                    refresh_timer['value'] = None
                     data = {
                         'connected': self._state.connected,
                         'position': {
@@ -173,15 +238,19 @@ class DiagnosticsPanel:
                             'determinant': self._state.geometry_determinant,
                         },
                     }
-                    import json
-                    state_display.content = json.dumps(data, indent=2)
+                    state_display.text = json.dumps(data, indent=2)
+
+                def schedule_state_display():
+                    if refresh_timer['value'] is not None:
+                        refresh_timer['value'].cancel()
+                    refresh_timer['value'] = ui.timer(STATE_REFRESH_DELAY, update_state_display, once=True)
 
                 update_state_display()
 
                 # Refresh button
                 ui.button(
                     'Refresh',
-                    on_click=update_state_display
+                    on_click=schedule_state_display
                 ).classes('mt-2').props('flat dense')
 
     def _build_performance_panel(self) -> None:
@@ -211,22 +280,27 @@ class DiagnosticsPanel:
                     ui.label('Errors').classes('label text-xs')
                     ui.label('0').classes('mono')
 
-    def _render_log_entry(self, entry: LogEntry) -> None:
-        """Render a single log entry."""
-        level_colors = {
-            'DEBUG': 'text-secondary',
-            'INFO': 'text-primary',
-            'WARNING': 'text-warning',
-            'ERROR': 'text-error',
-        }
-        color = level_colors.get(entry.level, '')
-
-        with ui.row().classes(f'w-full gap-2 {color}'):
-            ui.label(
-                entry.timestamp.strftime('%H:%M:%S.%f')[:-3]
-            ).classes('mono text-xs w-20')
-            ui.label(entry.level).classes('text-xs w-12')
-            ui.label(entry.message).classes('text-xs flex-grow')
+    def _render_log_view(self) -> str:
+        """Render the most recent entries at or above the filter level."""
+        rank = self._filter_rank
+        entries = [entry for entry in self._logs if entry.rank >= rank][-LOG_VIEW_ROWS:]
+        return ''.join(self._render_log_entry(entry) for entry in entries)
+
+    def _refresh_log_view(self) -> None:
+        """Re-render the log viewer, if built."""
+        if self._log_view is not None:
+            self._log_view.content = self._render_log_view()
+
+    def _render_log_entry(self, entry: LogEntry) -> str:
+        """Render a single log entry as an HTML row."""
+        color = LOG_LEVEL_COLORS.get(entry.level, '')
+        return (
+            f'<div class="flex w-full gap-2 {color}">'
+            f'<span class="mono text-xs w-20">{entry.time_text}</span>'
+            f'<span class="text-xs w-12">{html.escape(entry.level)}</span>'
+            f'<span class="text-xs flex-grow">{html.escape(entry.message)}</span>'
+            '</div>'
+        )
 
     def add_log(
         self,
@@ -249,17 +323,16 @@ class DiagnosticsPanel:
         )
         self._logs.append(entry)
 
-        # Trim if too many
-        if len(self._logs) > self._max_logs:
-            self._logs = self._logs[-self._max_logs:]
-
     def _set_filter(self, level: str) -> None:
         """Set log filter level."""
         self._filter_level = level
+        self._filter_rank = LOG_LEVEL_RANKS.get(level, 0)
+        self._refresh_log_view()
 
     def _clear_logs(self) -> None:
         """Clear log entries."""
         self._logs.clear()
+        self._refresh_log_view()
 
 
 def diagnostics_panel(
@@ -7,7 +7,7 @@ Mount hardware status, GPS information, and motor states.
 
 from nicegui import ui
 
-from ...state import TelescopeState
+from ...state import TelescopeState, format_serial_port
 
 
 def hardware_panel(state: TelescopeState) -> ui.element:
@@ -91,7 +91,7 @@ def hardware_panel(state: TelescopeState) -> ui.element:
                     if field in ('gps_enabled', 'gps_fix'):
                         update_gps_status()
 
-                state.add_listener(on_gps_change)
+                state.add_listener(on_gps_change, owner=container)
 
             # GPS details (only shown when enabled)
             gps_details = ui.column().classes('gap-4')
@@ -146,7 +146,7 @@ def hardware_panel(state: TelescopeState) -> ui.element:
                 if field == 'gps_enabled':
                     update_details_visibility()
 
-            state.add_listener(on_gps_enabled_change)
+            state.add_listener(on_gps_enabled_change, owner=container)
 
         # Connection Details card
         with ui.card().classes('gui-card w-full'):
@@ -180,16 +180,13 @@ def hardware_panel(state: TelescopeState) -> ui.element:
                             if field in ('connected', 'connection_error'):
                                 update_conn()
 
-                        state.add_listener(on_conn_change)
+                        state.add_listener(on_conn_change, owner=container)
 
                 # Serial port
                 with ui.column().classes('gap-1'):
                     ui.label('Serial Port').classes('label')
                     port_label = ui.label().classes('text-lg font-mono')
-                    port_label.bind_text_from(
-                        state, 'serial_port',
-                        lambda p: p if p else 'Not configured'
-                    )
+                    port_label.bind_text_from(state, 'serial_port', format_serial_port)
 
                 # Last communication
                 with ui.column().classes('gap-1'):
@@ -212,7 +209,7 @@ def hardware_panel(state: TelescopeState) -> ui.element:
                         if field == 'is_stale':
                             update_freshness()
 
-                    state.add_listener(on_fresh_change)
+                    state.add_listener(on_fresh_change, owner=container)
 
             # Error message (if any)
             error_container = ui.column().classes('w-full mt-2')
@@ -232,7 +229,7 @@ def hardware_panel(state: TelescopeState) -> ui.element:
                 if field == 'connection_error':
                     update_error_visibility()
 
-            state.add_listener(on_error_change)
+            state.add_listener(on_error_change, owner=container)
 
     return container
 
@@ -269,7 +266,7 @@ def _status_block(
                 if f == field:
                     update()
 
-            state.add_listener(on_change)
+            state.add_listener(on_change, owner=block)
 
     return block
 
@@ -82,7 +82,7 @@ def position_panel(state: TelescopeState) -> ui.element:
                         if field == 'alt_degrees':
                             update_horizon()
 
-                    state.add_listener(on_alt_change)
+                    state.add_listener(on_alt_change, owner=container)
 
                 # Azimuth
                 with ui.column().classes('gap-1'):
@@ -140,7 +140,7 @@ def position_panel(state: TelescopeState) -> ui.element:
                         if field in ('sidereal_time', 'ra_hours'):
                             update_ha()
 
-                    state.add_listener(on_ha_change)
+                    state.add_listener(on_ha_change, owner=container)
 
                 # Pier Side
                 with ui.column().classes('gap-1'):
@@ -167,7 +167,7 @@ def position_panel(state: TelescopeState) -> ui.element:
                             if field == 'pier_side':
                                 update_pier()
 
-                        state.add_listener(on_pier_change)
+                        state.add_listener(on_pier_change, owner=container)
 
     return container
 
@@ -204,16 +204,7 @@ def alignment_status(state: TelescopeState) -> ui.element:
                         lambda s: f'Lockout: {s:.0f}s remaining' if s > 0 else ''
                     )
 
-                def update_lockout_visibility():
-                    lockout_row.set_visibility(state.lockout_remaining_sec > 0)
-
-                update_lockout_visibility()
-
-                def on_lockout_change(field, value):
-                    if field == 'lockout_remaining_sec':
-                        update_lockout_visibility()
-
-                state.add_listener(on_lockout_change)
+                lockout_row.bind_visibility_from(state, 'lockout_active')
 
                 # Health alert
                 alert_row = ui.row().classes('items-center gap-2 text-error')
@@ -236,10 +227,7 @@ def alignment_status(state: TelescopeState) -> ui.element:
             with ui.row().classes('items-center gap-2'):
                 ui.label('Camera:').classes('label')
                 camera_label = ui.label().classes('mono text-sm')
-                camera_label.bind_text_from(
-                    state, 'camera_source',
-                    lambda s: s.upper()
-                )
+                camera_label.bind_text_from(state, 'camera_source_upper')
 
             # QA Subsystem section (Layer 3)
             qa_section = ui.column().classes('gap-2 disclosure-3')
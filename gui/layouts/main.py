@@ -139,10 +139,25 @@ def main_layout(
             else:
                 container.set_visibility(False)
 
+    # Detail panel builders, run once on first selection of their group
+    detail_builders = {
+        'controls': lambda: control_panel(state, handlers, config),
+        'position': lambda: position_panel(state),
+        'hardware': lambda: hardware_panel(state),
+        'alignment': lambda: alignment_panel(state, handlers),
+        'diagnostics': lambda: diagnostics_panel(state, handlers.get('send_command')),
+    }
+    built_groups = set()
+
     def switch_detail_group(group_id: str):
-        """Switch to a different detail group."""
+        """Switch to a different detail group, building its panel on first use."""
         current_group['value'] = group_id
 
+        if group_id not in built_groups and group_id in detail_builders:
+            built_groups.add(group_id)
+            with detail_containers[group_id]:
+                detail_builders[group_id]()
+
         # Show/hide detail containers
         for gid, container in detail_containers.items():
             if gid == group_id:
@@ -173,48 +188,18 @@ def main_layout(
             # Segmented navigation for detail groups
             segmented_nav(state, on_select=switch_detail_group)
 
-            # Detail panel container
+            # Detail panel container. One empty column per group; each panel is
+            # built on first selection and afterwards only toggled visible.
             with ui.column().classes('detail-panel w-full'):
-                # Controls panel
-                with ui.column().classes('w-full').bind_visibility_from(
-                    current_group, 'value', lambda v: v == 'controls'
-                ) as controls_container:
-                    detail_containers['controls'] = controls_container
-                    control_panel(state, handlers, config)
-
-                # Position panel
-                with ui.column().classes('w-full').bind_visibility_from(
-                    current_group, 'value', lambda v: v == 'position'
-                ) as position_container:
-                    detail_containers['position'] = position_container
-                    position_panel(state)
-
-                # Hardware panel
-                with ui.column().classes('w-full').bind_visibility_from(
-                    current_group, 'value', lambda v: v == 'hardware'
-                ) as hardware_container:
-                    detail_containers['hardware'] = hardware_container
-                    hardware_panel(state)
-
-                # Alignment panel
-                with ui.column().classes('w-full').bind_visibility_from(
-                    current_group, 'value', lambda v: v == 'alignment'
-                ) as alignment_container:
-                    detail_containers['alignment'] = alignment_container
-                    alignment_panel(state, handlers)
-
-                # Diagnostics panel
-                with ui.column().classes('w-full').bind_visibility_from(
-                    current_group, 'value', lambda v: v == 'diagnostics'
-                ) as diag_container:
-                    detail_containers['diagnostics'] = diag_container
-                    diagnostics_panel(state, handlers.get('send_command'))
+                for group_id in NAV_GROUPS:
+                    detail_containers[group_id] = ui.column().classes('w-full')
 
     # Footer
     footer(state, on_disclosure_change)
 
-    # Set initial page styling
+    # Set initial page styling and detail group visibility
     switch_page('mount')
+    switch_detail_group(current_group['value'])
 
 
 def header(
@@ -403,7 +388,7 @@ def footer(
                 if field in ('connected', 'connection_error'):
                     update_connection()
 
-            state.add_listener(on_conn_change)
+            state.add_listener(on_conn_change, owner=ftr)
 
             # Serial port
             port_label = ui.label().classes('text-xs text-secondary')
@@ -444,7 +429,7 @@ def footer(
                 if field == 'disclosure_level':
                     update_level_buttons()
 
-            state.add_listener(on_level_change)
+            state.add_listener(on_level_change, owner=ftr)
 
         # Right: Peripheral status indicators
         with ui.row().classes('items-center gap-4'):
@@ -490,7 +475,7 @@ def footer(
                                  'gps_longitude', 'gps_altitude', 'gps_satellites'):
                         update_gps()
 
-                state.add_listener(on_gps_change)
+                state.add_listener(on_gps_change, owner=ftr)
 
             # Camera indicator (alignment monitor camera)
             with ui.row().classes('items-center gap-1'):
@@ -521,7 +506,7 @@ def footer(
                     if field == 'alignment_state':
                         update_camera()
 
-                state.add_listener(on_camera_change)
+                state.add_listener(on_camera_change, owner=ftr)
 
             # Version
             ui.label('v0.1.0').classes('text-xs text-secondary')
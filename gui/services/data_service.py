@@ -377,77 +377,80 @@ class AlignmentDataService:
         if self._monitor is None:
             return
 
-        try:
-            # Get monitor state
-            monitor_state = getattr(self._monitor, 'state', None)
-            if monitor_state:
-                self._state.update(
-                    alignment_state=AlignmentState(monitor_state.value)
-                )
-
-            # Get error measurements
-            if hasattr(self._monitor, 'last_measurement'):
-                meas = self._monitor.last_measurement
-                if meas:
+        # Coalesce the per-field updates below into one notification pass
+        with self._state.batch():
+            try:
+                # Get monitor state
+                monitor_state = getattr(self._monitor, 'state', None)
+                if monitor_state:
+                    self._state.update(
+                        alignment_state=AlignmentState(monitor_state.value)
+                    )
+
+                # Get error measurements
+                if hasattr(self._monitor, 'last_measurement'):
+                    meas = self._monitor.last_measurement
+                    if meas:
+                        self._state.update(
+                            alignment_error_arcsec=getattr(meas, 'total_error', 0.0),
+                            alignment_error_ra=getattr(meas, 'ra_error', 0.0),
+                            alignment_error_dec=getattr(meas, 'dec_error', 0.0),
+                        )
+
+                # Get geometry
+                if hasattr(self._monitor, 'geometry_determinant'):
                     self._state.update(
-                        alignment_error_arcsec=getattr(meas, 'total_error', 0.0),
-                        alignment_error_ra=getattr(meas, 'ra_error', 0.0),
-                        alignment_error_dec=getattr(meas, 'dec_error', 0.0),
+                        geometry_determinant=self._monitor.geometry_determinant
                     )
 
-            # Get geometry
-            if hasattr(self._monitor, 'geometry_determinant'):
-                self._state.update(
-                    geometry_determinant=self._monitor.geometry_determinant
-                )
+                # Get decision info
+                if hasattr(self._monitor, 'last_decision'):
+                    decision = self._monitor.last_decision
+                    if decision:
+                        self._state.update(
+                            last_decision=DecisionResult(decision.value)
+                        )
 
-            # Get decision info
-            if hasattr(self._monitor, 'last_decision'):
-                decision = self._monitor.last_decision
-                if decision:
+                # Get lockout
+                if hasattr(self._monitor, 'lockout_remaining'):
                     self._state.update(
-                        last_decision=DecisionResult(decision.value)
+                        lockout_remaining_sec=self._monitor.lockout_remaining
                     )
 
-            # Get lockout
-            if hasattr(self._monitor, 'lockout_remaining'):
-                self._state.update(
-                    lockout_remaining_sec=self._monitor.lockout_remaining
-                )
-
-            # Get health alert
-            if hasattr(self._monitor, 'health_alert_active'):
-                self._state.update(
-                    health_alert=self._monitor.health_alert_active
-                )
-
-            # Get camera source
-            if hasattr(self._monitor, 'camera_source_type'):
-                self._state.update(
-                    camera_source=self._monitor.camera_source_type
-                )
-
-            # Get QA subsystem status
-            if hasattr(self._monitor, 'is_qa_enabled') and self._monitor.is_qa_enabled():
-                self._state.update(qa_enabled=True)
-
-                qa_status = self._monitor.get_alignment_qa_status()
-                if qa_status:
-                    # Convert status code string to enum
-                    status_str = qa_status.status.value if hasattr(qa_status.status, 'value') else str(qa_status.status)
-                    try:
-                        qa_status_enum = QAStatusCode(status_str)
-                    except ValueError:
-                        qa_status_enum = QAStatusCode.DISABLED
+                # Get health alert
+                if hasattr(self._monitor, 'health_alert_active'):
+                    self._state.update(
+                        health_alert=self._monitor.health_alert_active
+                    )
 
+                # Get camera source
+                if hasattr(self._monitor, 'camera_source_type'):
                     self._state.update(
-                        qa_status=qa_status_enum,
-                        qa_quaternion_delta=qa_status.quaternion_delta_arcsec,
-                        qa_synthetic_count=qa_status.synthetic_point_count,
-                        qa_model_valid=qa_status.model_valid,
+                        camera_source=self._monitor.camera_source_type
                     )
-            else:
-                self._state.update(qa_enabled=False)
 
-        except Exception as e:
-            self._logger.error(f"Error fetching alignment data: {e}")
+                # Get QA subsystem status
+                if hasattr(self._monitor, 'is_qa_enabled') and self._monitor.is_qa_enabled():
+                    self._state.update(qa_enabled=True)
+
+                    qa_status = self._monitor.get_alignment_qa_status()
+                    if qa_status:
+                        # Convert status code string to enum
+                        status = qa_status.status
+                        status_str = status.value if hasattr(status, 'value') else str(status)
+                        try:
+                            qa_status_enum = QAStatusCode(status_str)
+                        except ValueError:
+                            qa_status_enum = QAStatusCode.DISABLED
+
+                        self._state.update(
+                            qa_status=qa_status_enum,
+                            qa_quaternion_delta=qa_status.quaternion_delta_arcsec,
+                            qa_synthetic_count=qa_status.synthetic_point_count,
+                            qa_model_valid=qa_status.model_valid,
+                        )
+                else:
+                    self._state.update(qa_enabled=False)
+
+            except Exception as e:
+                self._logger.error(f"Error fetching alignment data: {e}")
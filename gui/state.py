@@ -5,11 +5,18 @@ State Management for TTS160 GUI
 Reactive state container for UI updates using NiceGUI's reactive system.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+import inspect
+import math
 import threading
+import weakref
+
+from nicegui import binding
 
 
 class DisclosureLevel(Enum):
@@ -51,6 +58,57 @@ class QAStatusCode(Enum):
     DISABLED = "disabled"     # QA subsystem is disabled
 
 
+# Absolute tolerances for float fields. Changes smaller than these are below
+# the displayed precision, so update() treats them as unchanged.
+FIELD_TOLERANCES: Dict[str, float] = {
+    'alignment_error_arcsec': 1e-2,
+    'alignment_error_ra': 1e-2,
+    'alignment_error_dec': 1e-2,
+    'geometry_determinant': 1e-3,
+    'qa_quaternion_delta': 1e-2,
+}
+
+# Fields stored at a coarser resolution than they are reported. Lockout is
+# shown in whole seconds, so round up (a partial second is still locked out).
+FIELD_QUANTIZERS: Dict[str, Callable[[float], Any]] = {
+    'lockout_remaining_sec': lambda sec: float(math.ceil(sec)),
+}
+
+
+class _ListenerRef:
+    """State listener entry that does not keep its owner alive.
+
+    Bound methods are held through a WeakMethod, and an optional owner
+    (typically the UI container the callback updates) is held weakly. The
+    entry is dead once either is garbage collected or the owner element has
+    been deleted.
+    """
+
+    __slots__ = ('_callback', '_method', '_owner')
+
+    def __init__(self, callback: Callable[[str, Any], None], owner: Any = None):
+        if inspect.ismethod(callback):
+            self._callback = None
+            self._method = weakref.WeakMethod(callback)
+        else:
+            self._callback = callback
+            self._method = None
+        self._owner = weakref.ref(owner) if owner is not None else None
+
+    def resolve(self) -> Optional[Callable[[str, Any], None]]:
+        """Return the live callback, or None if the entry is dead."""
+        if self._owner is not None:
+            owner = self._owner()
+            if owner is None or getattr(owner, 'is_deleted', False):
+                return None
+        return self._callback if self._method is None else self._method()
+
+    def matches(self, callback: Callable[[str, Any], None]) -> bool:
+        """Check whether this entry was registered for callback."""
+        target = self._callback if self._method is None else self._method()
+        return target is not None and target == callback
+
+
 @dataclass
 class TelescopeState:
     """Reactive state container for telescope data.
@@ -117,14 +175,31 @@ class TelescopeState:
     last_update: Optional[datetime] = None
     is_stale: bool = False
 
+    # Display-case camera source, maintained by update() (not a dataclass field)
+    camera_source_upper = binding.BindableProperty()
+
+    # Whether a lockout is running, maintained by update() (not a dataclass field).
+    # Flips only at the start and end of a lockout window.
+    lockout_active = binding.BindableProperty()
+
     def __post_init__(self):
         """Initialize internal state."""
         self._lock = threading.RLock()
-        self._listeners: List[Callable[[str, Any], None]] = []
+        self._listeners: List[_ListenerRef] = []
+        self._field_listeners: Dict[str, List[_ListenerRef]] = {}
+        self._group_listeners: List[Tuple[FrozenSet[str], _ListenerRef]] = []
+        # Batch depth and deferred changes are per thread, so a batch never
+        # holds the lock (or defers notifications) for other threads
+        self._batch = threading.local()
+        self.camera_source_upper = self.camera_source.upper()
+        self.lockout_active = self.lockout_remaining_sec > 0
 
     def update(self, **kwargs) -> None:
         """Update state fields and notify listeners.
 
+        Values equal to the current one (within FIELD_TOLERANCES, after
+        FIELD_QUANTIZERS are applied) are ignored and notify nobody.
+
         Args:
             **kwargs: Field names and new values.
         """
@@ -133,41 +208,190 @@ class TelescopeState:
             for key, value in kwargs.items():
                 if hasattr(self, key):
                     old_value = getattr(self, key)
-                    if old_value != value:
-                        setattr(self, key, value)
-                        changed_fields.append((key, value))
+                    quantize = FIELD_QUANTIZERS.get(key)
+                    if quantize is not None and value is not None:
+                        value = quantize(value)
+                    if old_value == value:
+                        continue
+                    tolerance = FIELD_TOLERANCES.get(key)
+                    if (tolerance is not None and old_value is not None and value is not None
+                            and math.isclose(old_value, value, rel_tol=0.0, abs_tol=tolerance)):
+                        continue
+                    setattr(self, key, value)
+                    changed_fields.append((key, value))
 
             if changed_fields:
                 self.last_update = datetime.now()
                 self.is_stale = False
 
-                # Notify listeners
-                for field_name, new_value in changed_fields:
-                    for listener in self._listeners:
-                        try:
-                            listener(field_name, new_value)
-                        except Exception:
-                            pass  # Don't let listener errors break updates
+                if 'camera_source' in kwargs:
+                    self.camera_source_upper = self.camera_source.upper()
+                if 'lockout_remaining_sec' in kwargs:
+                    self.lockout_active = self.lockout_remaining_sec > 0
+
+                # Notify listeners (deferred until this thread's outermost batch exits)
+                if getattr(self._batch, 'depth', 0):
+                    self._batch.pending.update(changed_fields)
+                else:
+                    self._dispatch(dict(changed_fields))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer listener notifications until the block exits.
+
+        Updates made inside the block are applied immediately, but each
+        changed field notifies its listeners only once, with its final
+        value, when the outermost batch exits. Batches may be nested.
+
+        The batch belongs to the calling thread and the state lock is not
+        held while the block runs, so updates from other threads proceed
+        (and notify) as usual.
+
+        Example:
+            with state.batch():
+                state.update(alignment_error_ra=1.0)
+                state.update(alignment_error_dec=2.0)
+        """
+        batch = self._batch
+        depth = getattr(batch, 'depth', 0)
+        if not depth:
+            batch.pending = {}
+        batch.depth = depth + 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if not batch.depth and batch.pending:
+                pending, batch.pending = batch.pending, {}
+                with self._lock:
+                    self._dispatch(pending)
+
+    def _dispatch(self, changes: Dict[str, Any]) -> None:
+        """Notify field listeners for each change, then group listeners once.
+
+        Args:
+            changes: Changed field names mapped to their new values.
+        """
+        for field_name, new_value in changes.items():
+            self._notify(field_name, new_value)
+
+        if not self._group_listeners:
+            return
+        dead = []
+        for fields, entry in self._group_listeners:
+            changed = fields.intersection(changes)
+            if not changed:
+                continue
+            listener = entry.resolve()
+            if listener is None:
+                dead.append((fields, entry))
+                continue
+            try:
+                listener(changed)
+            except Exception:
+                pass  # Don't let listener errors break updates
+        for item in dead:
+            self._group_listeners.remove(item)
+
+    def _notify(self, field_name: str, new_value: Any) -> None:
+        """Call wildcard listeners and listeners subscribed to one field.
+
+        Dead entries (collected or deleted owners) are pruned on the way.
 
-    def add_listener(self, callback: Callable[[str, Any], None]) -> None:
+        Args:
+            field_name: Name of the changed field.
+            new_value: New field value.
+        """
+        for listeners in (self._listeners, self._field_listeners.get(field_name, ())):
+            dead = []
+            for entry in listeners:
+                listener = entry.resolve()
+                if listener is None:
+                    dead.append(entry)
+                    continue
+                try:
+                    listener(field_name, new_value)
+                except Exception:
+                    pass  # Don't let listener errors break updates
+            for entry in dead:
+                listeners.remove(entry)
+
+    def add_listener(
+        self,
+        callback: Callable[[str, Any], None],
+        field_name: Optional[str] = None,
+        owner: Any = None,
+    ) -> None:
         """Add a state change listener.
 
+        Bound methods are held weakly, so a listener object that is no longer
+        referenced elsewhere stops receiving updates.
+
         Args:
             callback: Function called with (field_name, new_value) on changes.
+            field_name: Only notify for changes to this field. If None, the
+                callback is notified for every field.
+            owner: Optional object (e.g. the panel container) whose lifetime
+                bounds the listener. Held weakly; the listener is dropped once
+                the owner is collected or its element is deleted.
         """
         with self._lock:
-            if callback not in self._listeners:
-                self._listeners.append(callback)
-
-    def remove_listener(self, callback: Callable[[str, Any], None]) -> None:
+            if field_name is None:
+                listeners = self._listeners
+            else:
+                listeners = self._field_listeners.setdefault(field_name, [])
+            if not any(entry.matches(callback) for entry in listeners):
+                listeners.append(_ListenerRef(callback, owner))
+
+    def remove_listener(
+        self,
+        callback: Callable[[str, Any], None],
+        field_name: Optional[str] = None,
+    ) -> None:
         """Remove a state change listener.
 
         Args:
             callback: Previously registered callback.
+            field_name: Field the callback was registered for, if any.
+        """
+        with self._lock:
+            if field_name is None:
+                listeners = self._listeners
+            else:
+                listeners = self._field_listeners.get(field_name, [])
+            listeners[:] = [entry for entry in listeners if not entry.matches(callback)]
+
+    def add_group_listener(
+        self,
+        callback: Callable[[Set[str]], None],
+        fields: Iterable[str],
+        owner: Any = None,
+    ) -> None:
+        """Add a listener for a group of related fields.
+
+        The callback runs once per update (or once per batch) with the set of
+        fields from the group that changed, instead of once per field.
+
+        Args:
+            callback: Function called with the set of changed field names.
+            fields: Field names the listener is interested in.
+            owner: Optional object whose lifetime bounds the listener, as
+                for add_listener().
         """
         with self._lock:
-            if callback in self._listeners:
-                self._listeners.remove(callback)
+            if not any(entry.matches(callback) for _, entry in self._group_listeners):
+                self._group_listeners.append((frozenset(fields), _ListenerRef(callback, owner)))
+
+    def remove_group_listener(self, callback: Callable[[Set[str]], None]) -> None:
+        """Remove a group listener.
+
+        Args:
+            callback: Previously registered callback.
+        """
+        with self._lock:
+            self._group_listeners[:] = [
+                item for item in self._group_listeners if not item[1].matches(callback)
+            ]
 
     def get_position_dict(self) -> Dict[str, float]:
         """Get position data as dictionary.
@@ -244,6 +468,43 @@ class TelescopeState:
             return self.is_stale
 
 
+# Fields bound directly by UI elements. Declaring them as BindableProperty makes
+# assignments push to bound elements instead of being polled by NiceGUI's
+# binding refresh loop.
+BINDABLE_FIELDS = (
+    'connection_error',
+    'serial_port',
+    'last_communication',
+    'ra_hours',
+    'dec_degrees',
+    'alt_degrees',
+    'az_degrees',
+    'sidereal_time',
+    'pier_side',
+    'tracking_enabled',
+    'tracking_rate',
+    'gps_satellites',
+    'gps_latitude',
+    'gps_longitude',
+    'gps_altitude',
+    'camera_source',
+    'alignment_error_arcsec',
+    'alignment_error_ra',
+    'alignment_error_dec',
+    'geometry_determinant',
+    'last_decision',
+    'lockout_remaining_sec',
+    'qa_quaternion_delta',
+    'qa_synthetic_count',
+)
+
+for _name in BINDABLE_FIELDS:
+    _prop = binding.BindableProperty()
+    _prop.__set_name__(TelescopeState, _name)
+    setattr(TelescopeState, _name, _prop)
+del _name, _prop
+
+
 def create_state() -> TelescopeState:
     """Create a new telescope state instance.
 
@@ -253,7 +514,10 @@ def create_state() -> TelescopeState:
     return TelescopeState()
 
 
-# Formatting utilities for display
+# Formatting utilities for display.
+# The scalar coordinate formatters are memoised: one position update is
+# formatted by every label bound to it (dashboard, position status, panels).
+@lru_cache(maxsize=256)
 def format_ra(hours: float) -> str:
     """Format RA in HMS notation.
 
@@ -269,6 +533,7 @@ def format_ra(hours: float) -> str:
     return f"{h:02d}h {m:02d}m {s:04.1f}s"
 
 
+@lru_cache(maxsize=256)
 def format_dec(degrees: float) -> str:
     """Format Dec in DMS notation.
 
@@ -326,3 +591,15 @@ def format_error(arcsec: float) -> str:
     if abs(arcsec) >= 60:
         return f"{arcsec / 60:.1f}'"
     return f'{arcsec:.1f}"'
+
+
+def format_serial_port(port: str) -> str:
+    """Format the configured serial port.
+
+    Args:
+        port: Serial port name, empty if unset.
+
+    Returns:
+        The port name, or "Not configured".
+    """
+    return port if port else 'Not configured'
@@ -16,6 +16,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from config import Config, ConfigError
+from TTS160Config import TTS160Config, TTS160ConfigError
 
 
 class TestConfigInitialization:
@@ -609,3 +610,68 @@ class TestConfigConstants:
         assert Config.SERVER_SECTION == 'server'
         assert Config.LOGGING_SECTION == 'logging'
         assert Config.GUI_SECTION == 'gui'
+
+
+@pytest.fixture
+def tts160_config(tmp_path):
+    """Create a TTS160Config backed by files under tmp_path."""
+    config_file = tmp_path / TTS160Config.DEFAULT_CONFIG_FILE
+    config_file.write_text("[device]\ndev_port = 'COM3'\n")
+    override_path = str(tmp_path / 'alpyca' / TTS160Config.DEFAULT_CONFIG_FILE)
+    with patch.object(TTS160Config, 'get_config_dir', return_value=tmp_path), \
+            patch.object(TTS160Config, 'OVERRIDE_CONFIG_PATH', override_path):
+        yield TTS160Config()
+
+
+class TestTTS160ConfigSave:
+    """Test TTS160Config persistence."""
+
+    @pytest.mark.unit
+    def test_save_skips_identical_data(self, tts160_config):
+        """Saving unchanged data should not rewrite the file."""
+        tts160_config.save()
+        with patch.object(TTS160Config, '_write_atomic') as write:
+            tts160_config.save()
+        write.assert_not_called()
+
+    @pytest.mark.unit
+    def test_save_writes_changed_data(self, tts160_config):
+        """Saving changed data should rewrite the file."""
+        tts160_config.save()
+        tts160_config.dev_port = 'COM4'
+        tts160_config.save()
+        assert toml.load(tts160_config._config_file)['device']['dev_port'] == 'COM4'
+
+    @pytest.mark.unit
+    def test_save_rewrites_externally_edited_file(self, tts160_config):
+        """A file edited outside the application should be rewritten."""
+        tts160_config.save()
+        tts160_config._config_file.write_text("[device]\ndev_port = 'COM9'\n# edited\n")
+        tts160_config.save()
+        assert toml.load(tts160_config._config_file)['device']['dev_port'] == 'COM3'
+
+    @pytest.mark.unit
+    def test_save_rewrites_deleted_file(self, tts160_config):
+        """A file removed outside the application should be recreated."""
+        tts160_config.save()
+        tts160_config._config_file.unlink()
+        tts160_config.save()
+        assert toml.load(tts160_config._config_file)['device']['dev_port'] == 'COM3'
+
+    @pytest.mark.unit
+    def test_failed_write_removes_temp_file(self, tts160_config):
+        """A failed write should keep the old file and leave no temp file behind."""
+        tts160_config.dev_port = 'COM4'
+        with patch('TTS160Config.os.replace', side_effect=OSError('disk full')):
+            with pytest.raises(TTS160ConfigError):
+                tts160_config.save()
+        assert toml.load(tts160_config._config_file)['device']['dev_port'] == 'COM3'
+        assert list(tts160_config._config_file.parent.glob('*.tmp')) == []
+
+    @pytest.mark.unit
+    def test_update_ignores_unknown_keys(self, tts160_config):
+        """update() should apply known settings and skip unknown names."""
+        applied = tts160_config.update({'dev_port': 'COM5', 'no_such_setting': 1, '_dict': {}})
+        assert applied == ['dev_port']
+        assert tts160_config.dev_port == 'COM5'
+        assert not hasattr(tts160_config, 'no_such_setting')
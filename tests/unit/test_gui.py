@@ -149,6 +149,96 @@ class TestTelescopeState:
 
         assert len(changes) == 0
 
+    def test_state_field_listener(self):
+        """Field listeners should only be notified for their field."""
+        from gui.state import create_state
+
+        state = create_state()
+        changes = []
+
+        def listener(field, value):
+            changes.append((field, value))
+
+        state.add_listener(listener, field_name='slewing')
+        state.update(connected=True, slewing=True)
+
+        assert changes == [('slewing', True)]
+
+        state.remove_listener(listener, field_name='slewing')
+        state.update(slewing=False)
+
+        assert changes == [('slewing', True)]
+
+    def test_state_listener_owner_lifetime(self):
+        """Listeners with a dead owner or bound-method target are dropped."""
+        import gc
+        from gui.state import create_state
+
+        class Owner:
+            is_deleted = False
+
+            def __init__(self):
+                self.changes = []
+
+            def on_change(self, field, value):
+                self.changes.append(field)
+
+        state = create_state()
+        owner = Owner()
+        method_target = Owner()
+        changes = []
+
+        state.add_listener(lambda f, v: changes.append(f), owner=owner)
+        state.add_listener(method_target.on_change)
+        state.update(connected=True)
+        assert changes == ['connected']
+        assert method_target.changes == ['connected']
+
+        owner.is_deleted = True
+        del method_target
+        gc.collect()
+        state.update(connected=False)
+
+        assert changes == ['connected']
+        assert state._listeners == []
+
+    def test_state_batch_coalesces_notifications(self):
+        """batch() should notify once per field with the final value."""
+        from gui.state import create_state
+
+        state = create_state()
+        changes = []
+
+        def listener(field, value):
+            changes.append((field, value))
+
+        state.add_listener(listener)
+        with state.batch():
+            state.update(alignment_error_ra=1.0)
+            state.update(alignment_error_ra=2.0, alignment_error_dec=3.0)
+            assert changes == []
+            assert state.alignment_error_ra == 2.0
+
+        assert sorted(changes) == [('alignment_error_dec', 3.0), ('alignment_error_ra', 2.0)]
+
+    def test_state_batch_does_not_block_other_threads(self):
+        """Another thread's update() should complete while a batch body runs."""
+        import threading
+        from gui.state import create_state
+
+        state = create_state()
+        changes = []
+        state.add_listener(lambda field, value: changes.append(field), field_name='connected')
+
+        with state.batch():
+            worker = threading.Thread(target=state.update, kwargs={'connected': True})
+            worker.start()
+            worker.join(timeout=2.0)
+
+            assert not worker.is_alive()
+            # Not deferred by this thread's batch
+            assert changes == ['connected']
+
     def test_state_no_update_if_unchanged(self):
         """No notification if value unchanged."""
         from gui.state import create_state
@@ -166,6 +256,58 @@ class TestTelescopeState:
 
         assert len(changes) == 0
 
+    def test_state_group_listener(self):
+        """Group listeners should run once with the changed fields of their group."""
+        from gui.state import create_state
+
+        state = create_state()
+        calls = []
+
+        def listener(changed):
+            calls.append(changed)
+
+        state.add_group_listener(listener, {'qa_status', 'qa_enabled', 'qa_model_valid'})
+        state.update(qa_enabled=True, qa_model_valid=True, connected=True)
+        assert calls == [{'qa_enabled', 'qa_model_valid'}]
+
+        state.update(connected=False)
+        assert len(calls) == 1
+
+        state.remove_group_listener(listener)
+        state.update(qa_enabled=False)
+        assert len(calls) == 1
+
+    def test_state_float_tolerance(self):
+        """Sub-display changes and partial lockout seconds should not notify."""
+        from gui.state import create_state
+
+        state = create_state()
+        state.update(alignment_error_ra=10.0, lockout_remaining_sec=4.2)
+        assert state.lockout_remaining_sec == 5.0
+
+        changes = []
+        state.add_listener(lambda field, value: changes.append(field))
+        state.update(alignment_error_ra=10.001, lockout_remaining_sec=4.9)
+        assert changes == []
+
+        state.update(alignment_error_ra=10.5, lockout_remaining_sec=0.3)
+        assert changes == ['alignment_error_ra', 'lockout_remaining_sec']
+        assert state.lockout_remaining_sec == 1.0
+        assert state.lockout_active is True
+
+        state.update(lockout_remaining_sec=0.0)
+        assert state.lockout_active is False
+
+    def test_camera_source_upper(self):
+        """camera_source_upper should track camera_source changes."""
+        from gui.state import create_state
+
+        state = create_state()
+        assert state.camera_source_upper == 'ALPACA'
+
+        state.update(camera_source='zwo')
+        assert state.camera_source_upper == 'ZWO'
+
     def test_get_position_dict(self):
         """get_position_dict should return position data."""
         from gui.state import create_state
@@ -247,6 +389,26 @@ class TestDisclosureLevel:
         assert DisclosureLevel.EXPANDED.value == 2
         assert DisclosureLevel.ADVANCED.value == 3
 
+    def test_nav_group_records(self):
+        """NAV_GROUP_RECORDS should mirror NAV_GROUPS in order."""
+        from gui.components.navigation import NAV_GROUPS, NAV_GROUP_RECORDS
+
+        assert [g.id for g in NAV_GROUP_RECORDS] == list(NAV_GROUPS)
+        for group in NAV_GROUP_RECORDS:
+            assert group.min_level_value == NAV_GROUPS[group.id]['min_level'].value
+
+    def test_nav_visibility_by_level(self):
+        """Cached visibility should match each group's minimum level."""
+        from gui.state import DisclosureLevel
+        from gui.components.navigation import _VISIBILITY_BY_LEVEL
+
+        visible, first = _VISIBILITY_BY_LEVEL[DisclosureLevel.BASIC]
+        assert visible == {'controls', 'position'}
+        assert first == 'controls'
+
+        visible, _ = _VISIBILITY_BY_LEVEL[DisclosureLevel.ADVANCED]
+        assert 'diagnostics' in visible
+
 
 # =============================================================================
 # Alignment State Tests
@@ -320,5 +482,48 @@ class TestCoordinateParsing:
         assert parse_dec('') is None
 
 
+class TestConfigPanel:
+    """Tests for config panel helpers."""
+
+    def test_pending_buffer(self):
+        """Pending buffer should return only changed fields and then reset."""
+        from gui.components.panels.config import _PendingBuffer
+
+        config = MagicMock()
+        pending = _PendingBuffer(config)
+        assert not pending
+
+        pending['zwo_gain'] = 100
+        pending.update({'site_latitude': 45.0})
+        assert pending
+
+        pending.apply()
+        assert config.zwo_gain == 100
+        assert config.site_latitude == 45.0
+
+        assert pending.drain() == {'site_latitude': 45.0, 'zwo_gain': 100}
+        assert not pending
+
+    def test_pending_buffer_commit_coerces(self):
+        """commit() should read the watched widget and apply the field's coercion."""
+        from gui.components.panels.config import _PendingBuffer
+
+        pending = _PendingBuffer(MagicMock())
+        widget = MagicMock(value=5)
+        pending.watch('zwo_gain', widget)
+
+        # Unchanged value is not an edit
+        pending.commit('zwo_gain')
+        assert not pending
+
+        widget.value = 7.0
+        pending.commit('zwo_gain')
+        pending.commit('not_a_field')
+
+        changes = pending.drain()
+        assert changes == {'zwo_gain': 7}
+        assert isinstance(changes['zwo_gain'], int)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])